@@ -0,0 +1,47 @@
+"""
+Numeric reducers shared by the data processor and the report generators.
+
+The per-unit severity buckets are counted in one pass over the defect counts;
+with numba installed that pass is compiled (nogil, so it can run alongside
+report generation threads), otherwise a sort + searchsorted equivalent is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+# Settlement readiness bins as lower defect-count edges of minor, major, extensive:
+# ready 0-2, minor 3-7, major 8-15, extensive 16+
+SETTLEMENT_EDGES = (3, 8, 16)
+
+def _bucket_counts_loop(defect_counts, low, mid, high):
+    """Units below low, in [low, mid), in [mid, high) and at/above high - one pass"""
+    ready = minor = major = extensive = 0
+    for i in range(defect_counts.shape[0]):
+        c = defect_counts[i]
+        if c >= high:
+            extensive += 1
+        elif c >= mid:
+            major += 1
+        elif c >= low:
+            minor += 1
+        else:
+            ready += 1
+    return ready, minor, major, extensive
+
+def _bucket_counts_numpy(defect_counts, low, mid, high):
+    """Sort-and-search equivalent of _bucket_counts_loop when numba is not installed"""
+    idx = np.searchsorted(np.sort(defect_counts), (low, mid, high))  # idx[k] = number of units below edge k
+    return idx[0], idx[1] - idx[0], idx[2] - idx[1], len(defect_counts) - idx[2]
+
+bucket_counts = njit(cache=True, nogil=True)(_bucket_counts_loop) if NUMBA_AVAILABLE else _bucket_counts_numpy
+
+def classify_units(defect_counts, edges=SETTLEMENT_EDGES):
+    """Return (ready, minor, major, extensive) unit counts as ints for an array of per-unit defect counts"""
+    defect_counts = np.asarray(defect_counts, dtype=np.int64)
+    return tuple(int(count) for count in bucket_counts(defect_counts, *edges))
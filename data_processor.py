@@ -1,5 +1,6 @@
 import pandas as pd
 from datetime import datetime, timedelta
+from aggregations import classify_units
 
 def process_inspection_data(df, mapping, building_info, user_priorities=None):
     """Process the inspection data with enhanced metrics calculation including user-defined urgent priorities and common area detection"""
@@ -229,10 +230,8 @@ def process_inspection_data(df, mapping, building_info, user_priorities=None):
     # Calculate settlement readiness using apartment defects only
     apartment_defects_per_unit = apartment_data[apartment_data["StatusClass"] == "Not OK"].groupby("Unit").size()
     
-    ready_units = (apartment_defects_per_unit <= 2).sum() if len(apartment_defects_per_unit) > 0 else 0
-    minor_work_units = ((apartment_defects_per_unit > 2) & (apartment_defects_per_unit <= 7)).sum() if len(apartment_defects_per_unit) > 0 else 0
-    major_work_units = ((apartment_defects_per_unit > 7) & (apartment_defects_per_unit <= 15)).sum() if len(apartment_defects_per_unit) > 0 else 0
-    extensive_work_units = (apartment_defects_per_unit > 15).sum() if len(apartment_defects_per_unit) > 0 else 0
+    # 0-2 / 3-7 / 8-15 / 16+ defects, counted in one pass over the per-unit counts
+    ready_units, minor_work_units, major_work_units, extensive_work_units = classify_units(apartment_defects_per_unit.to_numpy())
     
     # Add units with zero defects to ready category
     units_with_defects = set(apartment_defects_per_unit.index)
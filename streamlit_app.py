@@ -16,6 +16,12 @@ import uuid
 from PIL import Image
 import io
 
+# Report timestamps are Melbourne local time; resolve the zone once
+MELBOURNE_TZ = pytz.timezone("Australia/Melbourne")
+
+# Longest the Complete Package button waits on the background Word report
+WORD_REPORT_TIMEOUT_SECONDS = 300
+
 EXCEL_REPORT_AVAILABLE = False
 WORD_REPORT_AVAILABLE = False
 
@@ -27,7 +33,7 @@ except Exception as e:
 
 try:
     from docx import Document
-    from word_report_generator import generate_professional_word_report
+    from word_report_generator import generate_professional_word_report, generate_professional_word_report_async
     WORD_REPORT_AVAILABLE = True
 except Exception as e:
     WORD_IMPORT_ERROR = str(e)
@@ -3729,8 +3735,8 @@ def create_zip_package(excel_bytes, word_bytes, metrics):
     """Create a ZIP package containing both reports"""
     zip_buffer = BytesIO()
     
-    mel_tz = pytz.timezone("Australia/Melbourne")
-    timestamp = datetime.now(mel_tz).strftime("%Y%m%d_%H%M%S")
+    generated_at = datetime.now(MELBOURNE_TZ)
+    timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
     
     # Generate professional filenames
     from excel_report_generator import generate_filename
@@ -3751,7 +3757,7 @@ def create_zip_package(excel_bytes, word_bytes, metrics):
 Building: {metrics['building_name']}
 Address: {metrics['address']}
 Inspection Date: {metrics['inspection_date']}
-Report Generated: {datetime.now(mel_tz).strftime('%Y-%m-%d %H:%M:%S AEDT')}
+Report Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S AEDT')}
 
 Key Metrics:
 - Total Units: {metrics['total_units']:,}
@@ -4471,6 +4477,18 @@ if st.session_state.processed_data is not None and st.session_state.metrics is n
                 if st.button("Generate Complete Package", type="primary", use_container_width=True):
                     try:
                         with st.spinner("Generating complete report package..."):
+                            # Start the Word report in the background so it renders alongside the Excel workbook
+                            word_future = None
+                            if WORD_REPORT_AVAILABLE:
+                                try:
+                                    word_future = generate_professional_word_report_async(
+                                        st.session_state.processed_data, 
+                                        metrics, 
+                                        st.session_state.report_images
+                                    )
+                                except Exception as e:
+                                    st.warning(f"Word report generation failed: {e}")
+                            
                             # Excel generation
                             if EXCEL_REPORT_AVAILABLE:
                                 excel_buffer = generate_professional_excel_report(st.session_state.processed_data, metrics)
@@ -4481,17 +4499,12 @@ if st.session_state.processed_data is not None and st.session_state.metrics is n
                             
                             # Word generation
                             word_bytes = None
-                            if WORD_REPORT_AVAILABLE:
+                            if word_future is not None:
                                 try:
-                                    doc = generate_professional_word_report(
-                                        st.session_state.processed_data, 
-                                        metrics, 
-                                        st.session_state.report_images
-                                    )
-                                    buf = BytesIO()
-                                    doc.save(buf)
-                                    buf.seek(0)
-                                    word_bytes = buf.getvalue()
+                                    word_bytes = word_future.result(timeout=WORD_REPORT_TIMEOUT_SECONDS)
+                                except TimeoutError:
+                                    word_future.cancel()
+                                    st.warning("Word report timed out - the package contains the Excel report only")
                                 except Exception as e:
                                     st.warning(f"Word report generation failed: {e}")
                             
@@ -4540,6 +4553,7 @@ if st.session_state.processed_data is not None and st.session_state.metrics is n
                     if st.button("Generate Word Report", type="secondary", use_container_width=True):
                         try:
                             with st.spinner("Generating Word report..."):
+                                # Nothing else to overlap with here, so build it in-process
                                 doc = generate_professional_word_report(
                                     st.session_state.processed_data, 
                                     metrics, 
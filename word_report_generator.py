@@ -1,37 +1,42 @@
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
+from docx.oxml.ns import qn, nsdecls
 from docx.oxml import parse_xml
+from docx.text.paragraph import Paragraph
 from docx.enum.section import WD_SECTION
+from docx.enum.style import WD_STYLE_TYPE
 from datetime import datetime
 import pandas as pd
 import os
 import tempfile
 from io import BytesIO
+from xml.sax.saxutils import escape
+from copy import deepcopy
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import atexit
+import multiprocessing
 import re
+import importlib.util
 
-# DEPENDENCY HANDLING - Added safe imports
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib
-    matplotlib.use('Agg')  # Use non-GUI backend for Streamlit
-    MATPLOTLIB_AVAILABLE = True
-    print("matplotlib loaded successfully for Word reports")
-except ImportError as e:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
-    print(f"matplotlib not available: {e}")
+from aggregations import classify_units
 
-try:
-    import seaborn as sns
-    SEABORN_AVAILABLE = True
-    print("seaborn loaded successfully for Word reports")
-except ImportError as e:
-    SEABORN_AVAILABLE = False
-    sns = None
-    print(f"seaborn not available: {e}")
+# DEPENDENCY HANDLING - Added safe imports
+# matplotlib is only looked up here and imported by _load_matplotlib() when the
+# first report with charts is built, so importing this module stays cheap
+matplotlib = Figure = None
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+if MATPLOTLIB_AVAILABLE:
+    print("matplotlib found for Word reports (imported on first chart)")
+else:
+    print("matplotlib not available: No module named 'matplotlib'")
+
+# seaborn is not used for drawing; the flag only feeds the dependency report
+SEABORN_AVAILABLE = importlib.util.find_spec('seaborn') is not None
+if not SEABORN_AVAILABLE:
+    print("seaborn not available: No module named 'seaborn'")
 
 try:
     import numpy as np
@@ -41,192 +46,242 @@ except ImportError:
     np = None
     print("numpy not available - some chart features may be limited")
 
-def remove_blank_pages(doc):
-    """
-    Remove blank pages from the Word document.
-    This function identifies and removes paragraphs that contain only page breaks
-    or are essentially empty.
-    """
-    try:
-        print("Checking for blank pages...")
-        pages_removed = 0
-        paragraphs_to_remove = []
-        
-        # Iterate through all paragraphs
-        for i, paragraph in enumerate(doc.paragraphs):
-            # Check if paragraph is essentially empty or contains only page breaks
-            is_blank_page_candidate = False
-            
-            # Check if paragraph text is empty or only whitespace
-            if not paragraph.text.strip():
-                # Check if paragraph contains only page breaks
-                for run in paragraph.runs:
-                    for elem in run.element:
-                        if elem.tag.endswith('br') and elem.get(qn('w:type')) == 'page':
-                            is_blank_page_candidate = True
-                            break
-                    if is_blank_page_candidate:
-                        break
-                
-                # Also consider completely empty paragraphs as candidates
-                if not paragraph.runs and not paragraph.text.strip():
-                    is_blank_page_candidate = True
-            
-            # Check for consecutive empty paragraphs that might form a blank page
-            if is_blank_page_candidate:
-                # Look ahead to see if there are multiple consecutive empty paragraphs
-                consecutive_empty = 1
-                j = i + 1
-                while j < len(doc.paragraphs) and j < i + 5:  # Check up to 5 paragraphs ahead
-                    next_para = doc.paragraphs[j]
-                    if not next_para.text.strip() and not next_para.runs:
-                        consecutive_empty += 1
-                        j += 1
-                    else:
-                        break
-                
-                # If we have multiple consecutive empty paragraphs, mark them for removal
-                if consecutive_empty >= 2:
-                    for k in range(i, min(i + consecutive_empty, len(doc.paragraphs))):
-                        if k < len(doc.paragraphs) and doc.paragraphs[k] not in paragraphs_to_remove:
-                            paragraphs_to_remove.append(doc.paragraphs[k])
-        
-        # Remove identified blank paragraphs
-        for paragraph in paragraphs_to_remove:
-            try:
-                # Remove the paragraph element from its parent
-                paragraph._element.getparent().remove(paragraph._element)
-                pages_removed += 1
-            except Exception as e:
-                print(f"Could not remove paragraph: {e}")
-                continue
-        
-        # Additional cleanup: Remove excessive consecutive empty paragraphs
-        cleanup_excessive_spacing(doc)
-        
-        if pages_removed > 0:
-            print(f"Removed {pages_removed} blank page elements")
-        else:
-            print("No blank pages detected")
-        
-        return pages_removed
-    
-    except Exception as e:
-        print(f"Error in remove_blank_pages: {e}")
-        return 0
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
 
-def cleanup_excessive_spacing(doc):
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = ImageDraw = ImageFont = None
+    print("Pillow not available - minimal charts disabled")
+
+# Opt-in fast path: draw the bar charts directly with Pillow instead of matplotlib
+MINIMAL_CHARTS = PIL_AVAILABLE and os.environ.get('WORD_REPORT_MINIMAL_CHARTS', '').lower() in ('1', 'true', 'yes')
+
+# Immutable length/color values shared by every run and style
+_BLACK = RGBColor(0, 0, 0)
+_PT6 = Pt(6)
+_PT8 = Pt(8)
+_PT10 = Pt(10)
+_PT11 = Pt(11)
+_PT12 = Pt(12)
+_PT14 = Pt(14)
+_PT16 = Pt(16)
+_PT18 = Pt(18)
+_PT20 = Pt(20)
+_PT28 = Pt(28)
+_PT30 = Pt(30)
+_CHART_WIDTH = Inches(7)
+
+# Separator lines for the cover page and section headers
+_SEP_SHORT = "─" * 40
+_SEP_MED = "─" * 50
+_SEP_LONG = "─" * 63
+_SEP_WIDE = "─" * 65
+
+# **bold** markers in generated text
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+
+# Cell border templates - deepcopy before appending to a tcPr
+_BORDERS_XML = ('<w:tcBorders{ns}>'
+                '<w:top w:val="single" w:sz="{sz}" w:space="0" w:color="{color}"/>'
+                '<w:left w:val="single" w:sz="{sz}" w:space="0" w:color="{color}"/>'
+                '<w:bottom w:val="single" w:sz="{sz}" w:space="0" w:color="{color}"/>'
+                '<w:right w:val="single" w:sz="{sz}" w:space="0" w:color="{color}"/>'
+                '</w:tcBorders>')
+_LIGHT_BORDERS_TEMPLATE = parse_xml(_BORDERS_XML.format(ns=' ' + nsdecls('w'), sz=4, color='D0D0D0'))
+
+_P_TAG = qn('w:p')
+_R_TAG = qn('w:r')
+_TBL_TAG = qn('w:tbl')
+_SECTPR_TAG = qn('w:sectPr')
+_RUN_BR_PATH = '%s/%s' % (qn('w:r'), qn('w:br'))
+_TYPE_ATTR = qn('w:type')
+
+# Unit severity bins as lower DefectCount edges of minor, major, extensive:
+# chart/severity sections use 0-2 / 3-7 / 8-14 / 15+, the priority framework 0-2 / 3-7 / 8-15 / 16+
+_SEVERITY_EDGES = (3, 8, 15)
+_PRIORITY_EDGES = (3, 8, 16)
+
+# Documents with fewer body paragraphs than this skip post-processing
+_POSTPROCESS_MIN_PARAGRAPHS = 500
+
+# Charts are embedded 7" wide; 150 dpi on the 10-16" figures is still print quality.
+# Fast zlib level: flat-color charts encode ~25% faster for somewhat larger PNGs
+_CHART_DPI = 150
+_CHART_PNG_OPTIONS = {'compress_level': 1}
+
+# Summaries with fewer rows than this get the text summary instead of a chart
+_MIN_CHART_ROWS = 3
+_TEXT_SUMMARY_NOTES = {True: "(Too few entries for a chart - showing text summary)",
+                       False: "(Visual charts require matplotlib - showing text summary)"}  # by MATPLOTLIB_AVAILABLE
+
+# Chart palettes
+_SEVERITY_COLORS = ('#ff9999', '#ffcc99', '#ffff99', '#99ff99', '#99ccff')  # critical, extensive, major, minor, ready
+_TRADE_COLORS = ('#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc') * 2
+_BAR_ALPHA = 0.8  # bars are drawn opaque in their palette color pre-blended onto white at this alpha
+_PIE_BASE_COLORS = ('#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc',
+                    '#c2c2f0', '#ffb3e6', '#c4e17f', '#76d7c4', '#f7dc6f')
+
+# Bar positions for the ranked bar charts (at most 20 bars), sliced per chart
+if NUMPY_AVAILABLE:
+    _YPOS_CACHE = np.arange(64)
+    _YPOS_CACHE.setflags(write=False)
+else:
+    _YPOS_CACHE = list(range(64))
+
+def validate_document_structure(doc):
     """
-    Clean up excessive spacing between sections by removing too many consecutive empty paragraphs.
-    Keeps maximum 2 empty paragraphs between content sections.
+    Validate the document structure and provide a summary of content distribution.
     """
     try:
-        paragraphs_to_remove = []
-        consecutive_empty_count = 0
-        
-        for i, paragraph in enumerate(doc.paragraphs):
-            # Check if paragraph is empty
-            if not paragraph.text.strip():
-                consecutive_empty_count += 1
-                # If we have more than 2 consecutive empty paragraphs, mark extras for removal
-                if consecutive_empty_count > 2:
-                    paragraphs_to_remove.append(paragraph)
+        # One lxml walk over the body children instead of materializing
+        # doc.paragraphs (twice) and doc.tables
+        total_paragraphs = 0
+        empty_paragraphs = 0
+        table_count = 0
+        for child in doc.element.body.iterchildren(_P_TAG, _TBL_TAG):
+            if child.tag == _P_TAG:
+                total_paragraphs += 1
+                if not ''.join(child.itertext()).strip():
+                    empty_paragraphs += 1
             else:
-                # Reset counter when we hit non-empty content
-                consecutive_empty_count = 0
-        
-        # Remove excessive empty paragraphs
-        for paragraph in paragraphs_to_remove:
-            try:
-                paragraph._element.getparent().remove(paragraph._element)
-            except Exception as e:
-                print(f"Could not remove excessive spacing paragraph: {e}")
-                continue
+                table_count += 1
+        content_paragraphs = total_paragraphs - empty_paragraphs
         
-        if len(paragraphs_to_remove) > 0:
-            print(f"Cleaned up {len(paragraphs_to_remove)} excessive spacing elements")
+        structure = {
+            'total_paragraphs': total_paragraphs,
+            'content_paragraphs': content_paragraphs,
+            'empty_paragraphs': empty_paragraphs,
+            'table_count': table_count
+        }
+        print_document_structure(structure)
+        return structure
     
     except Exception as e:
-        print(f"Error in cleanup_excessive_spacing: {e}")
+        print(f"Error in validate_document_structure: {e}")
+        return {}
 
-def optimize_page_breaks(doc):
-    """
-    Optimize page breaks to ensure they're properly placed and not creating blank pages.
-    """
-    try:
-        print("Optimizing page breaks...")
-        optimized_breaks = 0
-        
-        for paragraph in doc.paragraphs:
-            # Check for manual page breaks in empty paragraphs
-            if not paragraph.text.strip():
-                for run in paragraph.runs:
-                    # Look for page break runs in empty paragraphs
-                    for elem in run.element:
-                        if elem.tag.endswith('br') and elem.get(qn('w:type')) == 'page':
-                            # Check if this page break is immediately after content
-                            # If so, it's probably intentional; if not, consider removing
-                            para_index = doc.paragraphs.index(paragraph)
-                            
-                            # Look at previous paragraphs to see if there's recent content
-                            has_recent_content = False
-                            lookback_range = min(3, para_index)
-                            
-                            for j in range(1, lookback_range + 1):
-                                if para_index - j >= 0:
-                                    prev_para = doc.paragraphs[para_index - j]
-                                    if prev_para.text.strip():
-                                        has_recent_content = True
-                                        break
-                            
-                            # If no recent content, this might be an unnecessary page break
-                            if not has_recent_content:
-                                try:
-                                    run.element.remove(elem)
-                                    optimized_breaks += 1
-                                except:
-                                    pass
-        
-        if optimized_breaks > 0:
-            print(f"Optimized {optimized_breaks} page breaks")
-        
-        return optimized_breaks
+def print_document_structure(structure):
+    """Print a document structure summary as returned by validate_document_structure"""
     
-    except Exception as e:
-        print(f"Error in optimize_page_breaks: {e}")
-        return 0
+    content_paragraphs = structure['content_paragraphs']
+    empty_paragraphs = structure['empty_paragraphs']
+    
+    print(f"Document structure validation:")
+    print(f"  Total paragraphs: {structure['total_paragraphs']}")
+    print(f"  Content paragraphs: {content_paragraphs}")
+    print(f"  Empty paragraphs: {empty_paragraphs}")
+    print(f"  Tables: {structure['table_count']}")
+    
+    # Check for potential issues
+    if empty_paragraphs > content_paragraphs:
+        print(f"  WARNING: More empty paragraphs ({empty_paragraphs}) than content paragraphs ({content_paragraphs})")
 
-def validate_document_structure(doc):
+def _structure_from_scan(paras, table_count):
+    """Structure summary from (element, is_empty, has_runs, page_breaks) paragraph records"""
+    
+    empty_paragraphs = sum(1 for record in paras if record[1])
+    return {
+        'total_paragraphs': len(paras),
+        'content_paragraphs': len(paras) - empty_paragraphs,
+        'empty_paragraphs': empty_paragraphs,
+        'table_count': table_count
+    }
+
+def postprocess_document(doc, remove_blank=False, optimize_breaks=False):
     """
-    Validate the document structure and provide a summary of content distribution.
+    Post-process the document in a single traversal of the body.
+    
+    The blank-page, excessive-spacing and page-break rules are all defined
+    here: the body is scanned once, the rules are applied to the collected
+    paragraph records, and the before/after structure is derived from them.
     """
     try:
-        total_paragraphs = len(doc.paragraphs)
-        empty_paragraphs = sum(1 for p in doc.paragraphs if not p.text.strip())
-        content_paragraphs = total_paragraphs - empty_paragraphs
-        
-        # Count tables
-        table_count = len(doc.tables)
-        
-        print(f"Document structure validation:")
-        print(f"  Total paragraphs: {total_paragraphs}")
-        print(f"  Content paragraphs: {content_paragraphs}")
-        print(f"  Empty paragraphs: {empty_paragraphs}")
-        print(f"  Tables: {table_count}")
-        
-        # Check for potential issues
-        if empty_paragraphs > content_paragraphs:
-            print(f"  WARNING: More empty paragraphs ({empty_paragraphs}) than content paragraphs ({content_paragraphs})")
+        # Single scan: one record per body-level paragraph, plus the table count
+        paras = []
+        table_count = 0
+        for child in doc.element.body.iterchildren():
+            if child.tag == _P_TAG:
+                page_breaks = [br for br in child.iterfind(_RUN_BR_PATH) if br.get(_TYPE_ATTR) == 'page']
+                is_empty = not ''.join(child.itertext()).strip()
+                has_runs = child.find(_R_TAG) is not None
+                paras.append((child, is_empty, has_runs, page_breaks))
+            elif child.tag == _TBL_TAG:
+                table_count += 1
+        
+        initial_structure = _structure_from_scan(paras, table_count)
+        removed = set()
+        blank_pages_removed = 0
+        breaks_optimized = 0
+        
+        if remove_blank:
+            # Blank pages: an empty page-break (or run-less) paragraph followed by
+            # run-less empty paragraphs
+            for i, (_, is_empty, has_runs, page_breaks) in enumerate(paras):
+                if not is_empty or (has_runs and not page_breaks):
+                    continue
+                consecutive_empty = 1
+                j = i + 1
+                while j < len(paras) and j < i + 5 and paras[j][1] and not paras[j][2]:
+                    consecutive_empty += 1
+                    j += 1
+                if consecutive_empty >= 2:
+                    removed.update(range(i, i + consecutive_empty))
+            blank_pages_removed = len(removed)
+            
+            # Excessive spacing: keep at most 2 consecutive empty paragraphs
+            consecutive_empty_count = 0
+            for i, (_, is_empty, _, _) in enumerate(paras):
+                if i in removed:
+                    continue
+                if is_empty:
+                    consecutive_empty_count += 1
+                    if consecutive_empty_count > 2:
+                        removed.add(i)
+                else:
+                    consecutive_empty_count = 0
+        
+        if optimize_breaks:
+            # Page breaks in empty paragraphs with no content in the previous 3
+            # remaining paragraphs
+            position = 0
+            last_content_position = None
+            for i, (_, is_empty, _, page_breaks) in enumerate(paras):
+                if i in removed:
+                    continue
+                if not is_empty:
+                    last_content_position = position
+                elif page_breaks and (last_content_position is None or position - last_content_position > 3):
+                    for br in page_breaks:
+                        br.getparent().remove(br)
+                    breaks_optimized += len(page_breaks)
+                position += 1
+        
+        for i in removed:
+            elem = paras[i][0]
+            elem.getparent().remove(elem)
+        
+        if removed:
+            paras = [record for i, record in enumerate(paras) if i not in removed]
+        final_structure = _structure_from_scan(paras, table_count)
+        print_document_structure(final_structure)
         
         return {
-            'total_paragraphs': total_paragraphs,
-            'content_paragraphs': content_paragraphs,
-            'empty_paragraphs': empty_paragraphs,
-            'table_count': table_count
+            'blank_pages_removed': blank_pages_removed,
+            'breaks_optimized': breaks_optimized,
+            'initial_structure': initial_structure,
+            'final_structure': final_structure
         }
     
     except Exception as e:
-        print(f"Error in validate_document_structure: {e}")
+        print(f"Error in postprocess_document: {e}")
         return {}
 
 def generate_enhanced_word_report(processed_data, metrics, images=None):
@@ -235,67 +290,85 @@ def generate_enhanced_word_report(processed_data, metrics, images=None):
     """
     
     try:
+        # Work on a shallow copy so per-report caches stay out of the caller's metrics
+        metrics = dict(metrics)
+        _load_matplotlib()
+        flags = _summary_flags(metrics)
+        _report_date(metrics)
+        _formatted_metrics(metrics)
+        _prepare_report_views(metrics)
+        images = _load_images(images)
+        
         # Create new document
         doc = Document()
         
         # Setup document formatting with Arial font
         setup_document_formatting(doc)
         
-        # Add company logo to header if available
-        add_logo_to_header(doc, images)
-        
-        # Cover page with clean layout
-        add_clean_cover_page(doc, metrics, images)
-        
-        # Executive overview
-        add_executive_overview(doc, metrics)
-        
-        # Inspection process
-        add_inspection_process(doc, metrics)
-        
-        # Units analysis
-        add_units_analysis(doc, metrics)
-        
-        # Defects analysis
-        add_defects_analysis(doc, processed_data, metrics)
-        
-        # Data visualization
-        add_data_visualization(doc, processed_data, metrics)
-        
-        # Trade-specific summary
-        add_trade_summary(doc, processed_data, metrics)
-        
-        # Component breakdown
-        add_component_breakdown(doc, processed_data, metrics)
-        
-        # Strategic recommendations
-        add_recommendations(doc, metrics)
-        
-        # Professional footer
-        add_footer(doc, metrics)
-        
-        # POST-PROCESSING: Clean up the document (temporarily disabled for debugging)
-        print("\nPost-processing document...")
-        
-        # Validate initial structure
-        initial_structure = validate_document_structure(doc)
-        
-        # Temporarily disable blank page removal to check if it's causing the issue
-        print("Skipping blank page removal for debugging...")
-        blank_pages_removed = 0  # remove_blank_pages(doc)
-        
-        # Skip page break optimization too
-        print("Skipping page break optimization for debugging...")
-        breaks_optimized = 0  # optimize_page_breaks(doc)
-        
-        # Final validation
-        final_structure = validate_document_structure(doc)
-        
-        print(f"\nDocument optimization complete:")
-        print(f"  Blank page elements removed: {blank_pages_removed}")
-        print(f"  Page breaks optimized: {breaks_optimized}")
-        print(f"  Paragraphs before: {initial_structure.get('total_paragraphs', 0)}")
-        print(f"  Paragraphs after: {final_structure.get('total_paragraphs', 0)}")
+        # Render all four charts in parallel in the background while the text pages are built;
+        # each worker draws on its own Figure and Agg releases the GIL while rasterizing
+        with ThreadPoolExecutor(max_workers=4) as chart_pool:
+            units_chart = pie_chart = severity_chart = trade_chart = None
+            if not flags['unit_text']:
+                units_chart = chart_pool.submit(_render_units_chart, metrics)
+            if MATPLOTLIB_AVAILABLE:  # always the four severity buckets, however few units
+                severity_chart = chart_pool.submit(_render_severity_chart, metrics)
+            if not flags['trade_text']:
+                pie_chart = chart_pool.submit(_render_pie_chart, metrics)
+                trade_chart = chart_pool.submit(_render_trade_chart, metrics)
+            
+            # Add company logo to header if available
+            add_logo_to_header(doc, images)
+            
+            # Cover page with clean layout
+            add_clean_cover_page(doc, metrics, images)
+            
+            # Executive overview
+            add_executive_overview(doc, metrics)
+            
+            # Inspection process
+            add_inspection_process(doc, metrics)
+            
+            # Units analysis
+            add_units_analysis(doc, metrics, units_chart)
+            
+            # Defects analysis
+            add_defects_analysis(doc, processed_data, metrics)
+            
+            # Data visualization
+            add_data_visualization(doc, processed_data, metrics, trade_chart, pie_chart, severity_chart)
+            
+            # Trade-specific summary
+            add_trade_summary(doc, processed_data, metrics)
+            
+            # Component breakdown
+            add_component_breakdown(doc, processed_data, metrics)
+            
+            # The filtered defect rows are only read by the two component sections;
+            # drop them from the per-report copy rather than holding them through save
+            metrics.pop('_defects_only', None)
+            
+            # Strategic recommendations
+            add_recommendations(doc, metrics)
+            
+            # Professional footer
+            add_footer(doc, metrics)
+        
+        # POST-PROCESSING: Clean up the document in a single pass
+        # (blank page removal and page break optimization temporarily disabled for debugging)
+        # Typical reports are well under the threshold, so skip the pass for them
+        paragraph_count = sum(1 for _ in doc.element.body.iterchildren(_P_TAG))
+        if paragraph_count < _POSTPROCESS_MIN_PARAGRAPHS:
+            print(f"\nSkipping post-processing for small document ({paragraph_count} paragraphs)")
+        else:
+            print("\nPost-processing document...")
+            postprocess_result = postprocess_document(doc, remove_blank=False, optimize_breaks=False)
+            
+            print(f"\nDocument optimization complete:")
+            print(f"  Blank page elements removed: {postprocess_result.get('blank_pages_removed', 0)}")
+            print(f"  Page breaks optimized: {postprocess_result.get('breaks_optimized', 0)}")
+            print(f"  Paragraphs before: {postprocess_result.get('initial_structure', {}).get('total_paragraphs', 0)}")
+            print(f"  Paragraphs after: {postprocess_result.get('final_structure', {}).get('total_paragraphs', 0)}")
         
         return doc
     
@@ -303,6 +376,129 @@ def generate_enhanced_word_report(processed_data, metrics, images=None):
         print(f"Error in generate_enhanced_word_report: {e}")
         return create_error_document(e, metrics)
 
+def _load_matplotlib():
+    """
+    Import matplotlib on first use (on the calling thread, before any chart
+    worker starts); clears MATPLOTLIB_AVAILABLE if the import fails.
+    """
+    global matplotlib, Figure, MATPLOTLIB_AVAILABLE
+    
+    if MATPLOTLIB_AVAILABLE and Figure is None:
+        try:
+            import matplotlib
+            matplotlib.use('Agg')  # Use non-GUI backend for Streamlit
+            from matplotlib.figure import Figure  # pyplot-free figures are safe to render from worker threads
+        except ImportError as e:
+            MATPLOTLIB_AVAILABLE = False
+            print(f"matplotlib not available: {e}")
+    return MATPLOTLIB_AVAILABLE
+
+def _summary_flags(metrics):
+    """
+    Return the cached has-data flags for the summary frames shared by the sections;
+    *_text is set when that summary is written as text rather than charted.
+    """
+    
+    flags = metrics.get('_flags')
+    if flags is None:
+        flags = {
+            'trade': metrics.get('summary_trade') is not None and not metrics['summary_trade'].empty,
+            'unit': metrics.get('summary_unit') is not None and not metrics['summary_unit'].empty,
+        }
+        flags['trade_text'] = not MATPLOTLIB_AVAILABLE or (flags['trade'] and len(metrics['summary_trade']) < _MIN_CHART_ROWS)
+        flags['unit_text'] = not MATPLOTLIB_AVAILABLE or (flags['unit'] and len(metrics['summary_unit']) < _MIN_CHART_ROWS)
+        metrics['_flags'] = flags
+    return flags
+
+def _defects_only(processed_data, metrics=None):
+    """Return the 'Not OK' rows of processed_data, cached on metrics when one is given"""
+    
+    if metrics is not None and '_defects_only' in metrics:
+        return metrics['_defects_only']
+    defects_only = processed_data[processed_data['StatusClass'] == 'Not OK']
+    if metrics is not None:
+        metrics['_defects_only'] = defects_only
+    return defects_only
+
+def _severity_bucket_counts(metrics, edges=_SEVERITY_EDGES):
+    """
+    Return the cached (ready, minor, major, extensive) unit counts for the given
+    DefectCount bin edges - a single pass over the counts instead of a boolean
+    mask per bucket.
+    """
+    cache = metrics.setdefault('_severity_buckets', {})
+    counts = cache.get(edges)
+    if counts is None:
+        counts = classify_units(metrics['summary_unit']['DefectCount'].to_numpy(), edges)
+        cache[edges] = counts
+    return counts
+
+def _prepare_report_views(metrics):
+    """
+    Return the cached top-N views of the unit and trade summaries shared by the
+    chart builders and analysis text, extracted once as plain arrays.
+    """
+    views = metrics.get('_views')
+    if views is None:
+        views = {}
+        flags = _summary_flags(metrics)
+        
+        if flags['unit']:
+            top_units = metrics['summary_unit'].head(20)
+            views['top_unit_labels'] = [f"Unit {unit}" for unit in top_units['Unit']]
+            views['top_unit_counts'] = top_units['DefectCount'].to_numpy()
+            views['top_unit'] = (top_units['Unit'].iat[0], views['top_unit_counts'][0])
+        
+        if flags['trade']:
+            top_trades = metrics['summary_trade'].head(10)
+            total_defects = metrics.get('total_defects', 0)
+            counts = top_trades['DefectCount'].to_numpy()
+            views['top_trade_names'] = top_trades['Trade'].to_numpy()
+            views['top_trade_counts'] = counts
+            views['top_trade_pcts'] = counts / total_defects * 100 if total_defects > 0 else np.zeros(len(counts))
+            views['top_trade'] = (views['top_trade_names'][0], counts[0], views['top_trade_pcts'][0])
+        
+        metrics['_views'] = views
+    return views
+
+def _report_date(metrics):
+    """Return the cached report generation date so every section shows the same day"""
+    
+    report_date = metrics.get('_report_date')
+    if report_date is None:
+        generated_at = datetime.now()
+        report_date = generated_at.strftime('%d %B %Y')
+        metrics['_generated_at'] = generated_at
+        metrics['_report_date'] = report_date
+    return report_date
+
+def _formatted_metrics(metrics):
+    """Return the cached display strings for the headline metrics used across sections"""
+    
+    fmt = metrics.get('_fmt')
+    if fmt is None:
+        defect_rate = metrics.get('defect_rate', 0)
+        fmt = {
+            'total_units': f"{metrics.get('total_units', 0):,}",
+            'total_inspections': f"{metrics.get('total_inspections', 0):,}",
+            'total_defects': f"{metrics.get('total_defects', 0):,}",
+            'defect_rate': f"{defect_rate:.1f}",
+            'defect_rate_2dp': f"{defect_rate:.2f}",
+            'quality_score': f"{max(0, 100 - defect_rate):.1f}",
+            'avg_defects_per_unit': f"{metrics.get('avg_defects_per_unit', 0):.2f}",
+            'inspection_date': f"{metrics.get('inspection_date', 'N/A')}",
+            'building_name': f"{metrics.get('building_name', 'N/A')}",
+            'address': f"{metrics.get('address', 'N/A')}",
+            'report_date': _report_date(metrics),
+            'report_time': metrics['_generated_at'].strftime('%I:%M %p'),
+        }
+        for level in ('ready', 'minor', 'major', 'extensive'):
+            units_key = 'ready_units' if level == 'ready' else f'{level}_work_units'
+            fmt[units_key] = f"{metrics.get(units_key, 0)}"
+            fmt[f'{level}_pct'] = f"{metrics.get(f'{level}_pct', 0):.1f}"
+        metrics['_fmt'] = fmt
+    return fmt
+
 def setup_document_formatting(doc):
     """Setup document formatting with Arial font and clean styling"""
     
@@ -315,72 +511,120 @@ def setup_document_formatting(doc):
         section.right_margin = Cm(2.5)
     
     styles = doc.styles
+    existing_styles = {s.name for s in styles}
     
     # Title style - Arial, black
-    if 'CleanTitle' not in [s.name for s in styles]:
+    if 'CleanTitle' not in existing_styles:
         title_style = styles.add_style('CleanTitle', 1)
+        existing_styles.add('CleanTitle')
         title_font = title_style.font
         title_font.name = 'Arial'
-        title_font.size = Pt(28)
+        title_font.size = _PT28
         title_font.bold = True
-        title_font.color.rgb = RGBColor(0, 0, 0)  # Black
+        title_font.color.rgb = _BLACK
         title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_style.paragraph_format.space_after = Pt(12)
-        title_style.paragraph_format.space_before = Pt(10)
+        title_style.paragraph_format.space_after = _PT12
+        title_style.paragraph_format.space_before = _PT10
     
     # Section header - Arial, black
-    if 'CleanSectionHeader' not in [s.name for s in styles]:
+    if 'CleanSectionHeader' not in existing_styles:
         section_style = styles.add_style('CleanSectionHeader', 1)
+        existing_styles.add('CleanSectionHeader')
         section_font = section_style.font
         section_font.name = 'Arial'
-        section_font.size = Pt(18)
+        section_font.size = _PT18
         section_font.bold = True
-        section_font.color.rgb = RGBColor(0, 0, 0)  # Black
-        section_style.paragraph_format.space_before = Pt(20)
-        section_style.paragraph_format.space_after = Pt(10)
+        section_font.color.rgb = _BLACK
+        section_style.paragraph_format.space_before = _PT20
+        section_style.paragraph_format.space_after = _PT10
         section_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
     
     # Subsection header - Arial, black
-    if 'CleanSubsectionHeader' not in [s.name for s in styles]:
+    if 'CleanSubsectionHeader' not in existing_styles:
         subsection_style = styles.add_style('CleanSubsectionHeader', 1)
+        existing_styles.add('CleanSubsectionHeader')
         subsection_font = subsection_style.font
         subsection_font.name = 'Arial'
-        subsection_font.size = Pt(14)
+        subsection_font.size = _PT14
         subsection_font.bold = True
-        subsection_font.color.rgb = RGBColor(0, 0, 0)  # Black
-        subsection_style.paragraph_format.space_before = Pt(16)
-        subsection_style.paragraph_format.space_after = Pt(8)
+        subsection_font.color.rgb = _BLACK
+        subsection_style.paragraph_format.space_before = _PT16
+        subsection_style.paragraph_format.space_after = _PT8
     
     # Body text - Arial, black
-    if 'CleanBody' not in [s.name for s in styles]:
+    if 'CleanBody' not in existing_styles:
         body_style = styles.add_style('CleanBody', 1)
+        existing_styles.add('CleanBody')
         body_font = body_style.font
         body_font.name = 'Arial'
-        body_font.size = Pt(11)
-        body_font.color.rgb = RGBColor(0, 0, 0)  # Black
+        body_font.size = _PT11
+        body_font.color.rgb = _BLACK
         body_style.paragraph_format.line_spacing = 1.2
-        body_style.paragraph_format.space_after = Pt(6)
+        body_style.paragraph_format.space_after = _PT6
         body_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    
+    # Metrics grid table style - the white borders that separate the metric
+    # boxes are defined once here instead of repeated in every cell
+    if 'MetricsGrid' not in existing_styles:
+        grid_style = styles.add_style('MetricsGrid', WD_STYLE_TYPE.TABLE)
+        existing_styles.add('MetricsGrid')
+        grid_style.element.append(parse_xml(
+            '<w:tblPr %s><w:tblBorders>'
+            '<w:top w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>'
+            '<w:left w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>'
+            '<w:bottom w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>'
+            '<w:right w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>'
+            '<w:insideH w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>'
+            '<w:insideV w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>'
+            '</w:tblBorders></w:tblPr>' % nsdecls('w')
+        ))
+
+def _load_images(images):
+    """Read each image file once into memory; missing paths are dropped"""
+    
+    loaded = {}
+    for key, source in (images or {}).items():
+        try:
+            if isinstance(source, BytesIO):
+                loaded[key] = source
+            elif source and os.path.exists(source):
+                with open(source, 'rb') as f:
+                    loaded[key] = BytesIO(f.read())
+        except Exception as e:
+            print(f"Could not load image {key}: {e}")
+    return loaded
+
+def _image_source(images, key):
+    """Return the image for key as a rewound stream or an existing path, else None"""
+    
+    source = images.get(key) if images else None
+    if isinstance(source, BytesIO):
+        source.seek(0)
+        return source
+    if source and os.path.exists(source):
+        return source
+    return None
 
 def add_logo_to_header(doc, images=None):
     """Add company logo to document header (left side)"""
     
     try:
-        if images and images.get('logo') and os.path.exists(images['logo']):
+        logo = _image_source(images, 'logo')
+        if logo is not None:
             # Get the header for the first section
             section = doc.sections[0]
             header = section.header
             
             # Clear existing header content
-            header.paragraphs[0].clear()
+            header_para = header.paragraphs[0]
+            header_para.clear()
             
             # Add logo to header
-            header_para = header.paragraphs[0]
             header_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
             header_run = header_para.add_run()
             
             # Add logo with appropriate size for header
-            header_run.add_picture(images['logo'], width=Inches(2.0))
+            header_run.add_picture(logo, width=Inches(2.0))
     
     except Exception as e:
         print(f"Error adding logo to header: {e}")
@@ -389,230 +633,229 @@ def add_clean_cover_page(doc, metrics, images=None):
     """Add clean cover page matching Report_Modified.docx format"""
     
     try:
+        fmt = _formatted_metrics(metrics)
+        
         # Main title - split into 2 lines as requested
-        title_para = doc.add_paragraph()
+        title_para = _add_paragraph(doc)
         title_para.style = 'CleanTitle'
         title_run = title_para.add_run("PRE-SETTLEMENT\nINSPECTION REPORT")
-        title_run.font.size = Pt(30)  # Slightly smaller for 2-line layout
+        title_run.font.size = _PT30  # Slightly smaller for 2-line layout
         
         # Simple line separator
-        line_para = doc.add_paragraph()
+        line_para = _add_paragraph(doc)
         line_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        line_run = line_para.add_run("────────────────────────────────────────")
-        line_run.font.name = 'Arial'
-        line_run.font.size = Pt(12)
-        line_run.font.color.rgb = RGBColor(0, 0, 0)
+        _styled_run(line_para, _SEP_SHORT, 12)
         
         # Building name
-        doc.add_paragraph()
-        building_para = doc.add_paragraph()
+        _spacer(doc)
+        building_para = _add_paragraph(doc)
         building_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        building_run = building_para.add_run(f"{metrics.get('building_name', 'Building Name').upper()}")
-        building_run.font.name = 'Arial'
-        building_run.font.size = Pt(22)
-        building_run.font.bold = True
-        building_run.font.color.rgb = RGBColor(0, 0, 0)
+        _styled_run(building_para, f"{metrics.get('building_name', 'Building Name').upper()}", 22, bold=True)
         
         # Address
-        doc.add_paragraph()
-        address_para = doc.add_paragraph()
+        _spacer(doc)
+        address_para = _add_paragraph(doc)
         address_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        address_run = address_para.add_run(metrics.get('address', 'Address'))
-        address_run.font.name = 'Arial'
-        address_run.font.size = Pt(14)
-        address_run.font.color.rgb = RGBColor(0, 0, 0)
+        _styled_run(address_para, metrics.get('address', 'Address'), 14)
         
         # Cover image if available (center, appropriate size)
-        if images and images.get('cover') and os.path.exists(images['cover']):
+        cover = _image_source(images, 'cover')
+        if cover is not None:
             try:
-                doc.add_paragraph()
-                cover_para = doc.add_paragraph()
+                _spacer(doc)
+                cover_para = _add_paragraph(doc)
                 cover_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 cover_run = cover_para.add_run()
-                cover_run.add_picture(images['cover'], width=Inches(4.7))  # Adjusted size
-                doc.add_paragraph()
+                cover_run.add_picture(cover, width=Inches(4.7))  # Adjusted size
+                _spacer(doc)
             except Exception as e:
                 print(f"Error loading cover image: {e}")
         
         # Inspection Overview section
-        doc.add_paragraph()
-        overview_header = doc.add_paragraph()
+        _spacer(doc)
+        overview_header = _add_paragraph(doc)
         overview_header.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        overview_run = overview_header.add_run("INSPECTION OVERVIEW")
-        overview_run.font.name = 'Arial'
-        overview_run.font.size = Pt(20)
-        overview_run.font.bold = True
-        overview_run.font.color.rgb = RGBColor(0, 0, 0)
+        _styled_run(overview_header, "INSPECTION OVERVIEW", 20, bold=True)
         
         # Simple line separator
-        line_para2 = doc.add_paragraph()
+        line_para2 = _add_paragraph(doc)
         line_para2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        line_run2 = line_para2.add_run("──────────────────────────────────────────────────")
-        line_run2.font.name = 'Arial'
-        line_run2.font.size = Pt(12)
-        line_run2.font.color.rgb = RGBColor(0, 0, 0)
+        _styled_run(line_para2, _SEP_MED, 12)
         
-        doc.add_paragraph()
+        _spacer(doc)
         
         # Metrics table
         add_metrics_table(doc, metrics)
         
         # Add some space
-        doc.add_paragraph()
-        doc.add_paragraph()
-        doc.add_paragraph()
+        _spacer(doc, 3)
         
         # Report details - moved to bottom left
-        details_para = doc.add_paragraph()
+        details_para = _add_paragraph(doc)
         details_para.alignment = WD_ALIGN_PARAGRAPH.LEFT  # Changed from CENTER to LEFT
         
-        details_text = f"""Generated on {datetime.now().strftime('%d %B %Y')}
+        details_text = f"""Generated on {fmt['report_date']}
 
-Inspection Date: {metrics.get('inspection_date', 'N/A')}
-Units Inspected: {metrics.get('total_units', 0):,}
-Components Evaluated: {metrics.get('total_inspections', 0):,}
-Quality Score: {max(0, 100 - metrics.get('defect_rate', 0)):.1f}/100"""
+Inspection Date: {fmt['inspection_date']}
+Units Inspected: {fmt['total_units']}
+Components Evaluated: {fmt['total_inspections']}
+Quality Score: {fmt['quality_score']}/100"""
         
-        details_run = details_para.add_run(details_text)
-        details_run.font.name = 'Arial'
-        details_run.font.size = Pt(11)
-        details_run.font.color.rgb = RGBColor(0, 0, 0)
+        _styled_run(details_para, details_text, 11)
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in clean cover page: {e}")
 
+_METRIC_RUN_XML = ('<w:r><w:rPr><w:rFonts w:ascii="Arial" w:hAnsi="Arial"/>%s<w:color w:val="000000"/>'
+                   '<w:sz w:val="%d"/></w:rPr><w:t>%s</w:t>%s</w:r>')
+
+def _metric_run_xml(text, size, bold, line_break=False):
+    """One Arial, black run of the metrics table"""
+    return _METRIC_RUN_XML % ('<w:b/>' if bold else '<w:b w:val="0"/>', size * 2, escape(text),
+                              '<w:br/>' if line_break else '')
+
+def _build_metrics_tbl_xml(metrics_data, cell_width):
+    """
+    Return the <w:tbl> XML for the 2x3 metrics overview table.
+    
+    metrics_data holds (label, value, subtitle, fill color) per box; cell_width
+    is in twips. Columns are 2.4" wide and centered; the white borders that
+    create the gaps between the colored boxes come from the MetricsGrid style.
+    """
+    rows = []
+    for row_start in range(0, len(metrics_data), 3):
+        cells = []
+        for label, value, subtitle, bg_color in metrics_data[row_start:row_start + 3]:
+            cells.append(
+                '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="%d"/><w:shd w:fill="%s"/></w:tcPr>'
+                '<w:p><w:pPr><w:spacing w:before="240" w:after="240"/><w:ind w:left="160" w:right="160"/>'
+                '<w:jc w:val="center"/></w:pPr>%s%s%s</w:p></w:tc>'
+                % (cell_width, bg_color,
+                   _metric_run_xml(label, 10, False, line_break=True),
+                   _metric_run_xml(value, 24, True, line_break=True),
+                   _metric_run_xml(subtitle, 9, False))
+            )
+        rows.append('<w:tr>%s</w:tr>' % ''.join(cells))
+    
+    return ('<w:tbl %s><w:tblPr><w:tblStyle w:val="MetricsGrid"/><w:tblW w:type="auto" w:w="0"/><w:jc w:val="center"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+            '</w:tblPr><w:tblGrid>%s</w:tblGrid>%s</w:tbl>'
+            % (nsdecls('w'), '<w:gridCol w:w="3456"/>' * 3, ''.join(rows)))  # 3456 twips = 2.4"
+
 def add_metrics_table(doc, metrics):
     """Add metrics overview table with colored boxes and white borders"""
     
     try:
-        # Create a regular paragraph first to ensure proper spacing
-        doc.add_paragraph()
-        
-        # Create table with colored boxes
-        table = doc.add_table(rows=2, cols=3)
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        fmt = _formatted_metrics(metrics)
         
-        # Set column widths properly
-        table.columns[0].width = Inches(2.4)
-        table.columns[1].width = Inches(2.4)
-        table.columns[2].width = Inches(2.4)
+        # Create a regular paragraph first to ensure proper spacing
+        _spacer(doc)
         
         # Metrics data with corresponding colors
         metrics_data = [
-            ("TOTAL UNITS", f"{metrics.get('total_units', 0):,}", "Units Inspected", "A8D3E6"),
-            ("DEFECTS FOUND", f"{metrics.get('total_defects', 0):,}", f"{metrics.get('defect_rate', 0):.1f}% Rate", "F4C2A1"),
-            ("READY UNITS", f"{metrics.get('ready_units', 0)}", f"{metrics.get('ready_pct', 0):.1f}%", "C8E6C9"),
-            ("MINOR WORK", f"{metrics.get('minor_work_units', 0)}", f"{metrics.get('minor_pct', 0):.1f}%", "C8E6C9"),
-            ("MAJOR WORK", f"{metrics.get('major_work_units', 0)}", f"{metrics.get('major_pct', 0):.1f}%", "F4C2A1"),
-            ("EXTENSIVE WORK", f"{metrics.get('extensive_work_units', 0)}", f"{metrics.get('extensive_pct', 0):.1f}%", "F4A6A6")
+            ("TOTAL UNITS", f"{fmt['total_units']}", "Units Inspected", "A8D3E6"),
+            ("DEFECTS FOUND", f"{fmt['total_defects']}", f"{fmt['defect_rate']}% Rate", "F4C2A1"),
+            ("READY UNITS", f"{fmt['ready_units']}", f"{fmt['ready_pct']}%", "C8E6C9"),
+            ("MINOR WORK", f"{fmt['minor_work_units']}", f"{fmt['minor_pct']}%", "C8E6C9"),
+            ("MAJOR WORK", f"{fmt['major_work_units']}", f"{fmt['major_pct']}%", "F4C2A1"),
+            ("EXTENSIVE WORK", f"{fmt['extensive_work_units']}", f"{fmt['extensive_pct']}%", "F4A6A6")
         ]
         
-        # Fill cells with colored backgrounds and styling
-        for i, (label, value, subtitle, bg_color) in enumerate(metrics_data):
-            row_idx = i // 3
-            col_idx = i % 3
-            
-            try:
-                cell = table.cell(row_idx, col_idx)
-                
-                # Clear existing content
-                cell.text = ""
-                
-                # Set cell background color
-                try:
-                    shading_elm = parse_xml(f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="{bg_color}"/>')
-                    cell._tc.get_or_add_tcPr().append(shading_elm)
-                except:
-                    pass  # Continue without background color if this fails
-                
-                # Add white borders to create gaps between cells
-                try:
-                    tc = cell._tc
-                    tcPr = tc.get_or_add_tcPr()
-                    
-                    # Add white borders (FFFFFF = white, sz="8" makes it thicker for visible gaps)
-                    borders = parse_xml('''
-                        <w:tcBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-                            <w:top w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>
-                            <w:left w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>
-                            <w:bottom w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>
-                            <w:right w:val="single" w:sz="20" w:space="0" w:color="FFFFFF"/>
-                        </w:tcBorders>
-                    ''')
-                    tcPr.append(borders)
-                except:
-                    pass  # Continue without borders if this fails
-                
-                # Add content to cell
-                para = cell.paragraphs[0]
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
-                # Add padding to create space inside cells
-                para.paragraph_format.space_before = Pt(12)
-                para.paragraph_format.space_after = Pt(12)
-                para.paragraph_format.left_indent = Pt(8)
-                para.paragraph_format.right_indent = Pt(8)
-                
-                # Label
-                label_run = para.add_run(f"{label}\n")
-                label_run.font.name = 'Arial'
-                label_run.font.size = Pt(10)
-                label_run.font.color.rgb = RGBColor(0, 0, 0)
-                label_run.font.bold = False
-                
-                # Value (large number)
-                value_run = para.add_run(f"{value}\n")
-                value_run.font.name = 'Arial'
-                value_run.font.size = Pt(24)
-                value_run.font.bold = True
-                value_run.font.color.rgb = RGBColor(0, 0, 0)
-                
-                # Subtitle
-                subtitle_run = para.add_run(subtitle)
-                subtitle_run.font.name = 'Arial'
-                subtitle_run.font.size = Pt(9)
-                subtitle_run.font.color.rgb = RGBColor(0, 0, 0)
-                subtitle_run.font.bold = False
-                
-            except Exception as cell_error:
-                print(f"Error processing cell {i}: {cell_error}")
-                continue
-        
-        # Add table-level spacing to create overall gaps
-        try:
-            tbl = table._tbl
-            tblPr = tbl.get_or_add_tblPr()
-            
-            # Add cell spacing to create gaps between cells
-            cellSpacing = parse_xml('<w:tblCellSpacing xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:w="120" w:type="dxa"/>')
-            tblPr.append(cellSpacing)
-        except:
-            pass
+        # Build the whole table (colored boxes on the MetricsGrid style) as one
+        # XML string - a single parse instead of dozens of per-cell API mutations
+        tbl = parse_xml(_build_metrics_tbl_xml(metrics_data, int(doc._block_width / 3) // 635))
+        _append_to_body(doc, tbl)
         
         # Add spacing after table
-        doc.add_paragraph()
+        _spacer(doc)
     
     except Exception as e:
         print(f"Error in metrics table: {e}")
         # Fallback: Add text-based metrics if table fails
         try:
-            fallback_para = doc.add_paragraph("INSPECTION METRICS:")
+            fallback_para = _add_paragraph(doc, "INSPECTION METRICS:")
             fallback_para.style = 'CleanSubsectionHeader'
             
-            metrics_text = f"""Total Units: {metrics.get('total_units', 0):,}
-Defects Found: {metrics.get('total_defects', 0):,} ({metrics.get('defect_rate', 0):.1f}% Rate)
-Ready Units: {metrics.get('ready_units', 0)} ({metrics.get('ready_pct', 0):.1f}%)
-Minor Work: {metrics.get('minor_work_units', 0)} ({metrics.get('minor_pct', 0):.1f}%)
-Major Work: {metrics.get('major_work_units', 0)} ({metrics.get('major_pct', 0):.1f}%)
-Extensive Work: {metrics.get('extensive_work_units', 0)} ({metrics.get('extensive_pct', 0):.1f}%)"""
+            metrics_text = f"""Total Units: {fmt['total_units']}
+Defects Found: {fmt['total_defects']} ({fmt['defect_rate']}% Rate)
+Ready Units: {fmt['ready_units']} ({fmt['ready_pct']}%)
+Minor Work: {fmt['minor_work_units']} ({fmt['minor_pct']}%)
+Major Work: {fmt['major_work_units']} ({fmt['major_pct']}%)
+Extensive Work: {fmt['extensive_work_units']} ({fmt['extensive_pct']}%)"""
             
-            fallback_text_para = doc.add_paragraph(metrics_text)
+            fallback_text_para = _add_paragraph(doc, metrics_text)
             fallback_text_para.style = 'CleanBody'
         except:
             pass
 
+def _append_to_body(doc, element):
+    """Append a block element to the document body, keeping the trailing sectPr last"""
+    
+    body = doc.element.body
+    try:
+        last = body[-1]
+    except IndexError:
+        last = None
+    
+    if last is not None and last.tag == _SECTPR_TAG:
+        last.addprevious(element)
+    else:
+        body.append(element)
+    return element
+
+def _add_paragraph(doc, text='', style=None):
+    """
+    Append a paragraph to the document body in constant time.
+    
+    doc.add_paragraph() locates the trailing sectPr by scanning every body
+    child, so building a long report that way is quadratic.
+    """
+    # body.makeelement goes through python-docx's parser lookup, so this is a CT_P
+    paragraph = Paragraph(_append_to_body(doc, doc.element.body.makeelement(_P_TAG)), doc._body)
+    if text:
+        paragraph.add_run(text)
+    if style is not None:
+        paragraph.style = style
+    return paragraph
+
+def _spacer(doc, count=1):
+    """Append count empty <w:p/> for vertical whitespace, without wrapping them in Paragraphs"""
+    body = doc.element.body
+    for _ in range(count):
+        _append_to_body(doc, body.makeelement(_P_TAG))
+
+@lru_cache(maxsize=None)
+def _run_properties(size, bold=None):
+    """Parsed Arial/black <w:rPr> for a point size - deepcopy it before inserting"""
+    bold_xml = '' if bold is None else ('<w:b/>' if bold else '<w:b w:val="0"/>')
+    return parse_xml('<w:rPr %s><w:rFonts w:ascii="Arial" w:hAnsi="Arial"/>%s<w:color w:val="000000"/><w:sz w:val="%d"/></w:rPr>'
+                     % (nsdecls('w'), bold_xml, size * 2))
+
+def _styled_run(paragraph, text, size=11, bold=None):
+    """Add an Arial, black run of the given point size with its rPr written in one step"""
+    
+    run = paragraph.add_run(text)
+    run._r.insert(0, deepcopy(_run_properties(size, bold)))
+    return run
+
+@lru_cache(maxsize=4)
+def _deco_line_element(line):
+    """Parsed left-aligned Arial 10pt black separator paragraph - deepcopy it before inserting"""
+    return parse_xml('<w:p %s><w:pPr><w:jc w:val="left"/></w:pPr><w:r><w:rPr><w:rFonts w:ascii="Arial" w:hAnsi="Arial"/>'
+                     '<w:color w:val="000000"/><w:sz w:val="20"/></w:rPr><w:t>%s</w:t></w:r></w:p>' % (nsdecls('w'), line))
+
+def _add_deco_line(doc, line=_SEP_LONG):
+    """Add a decorative separator line under a section header"""
+    _append_to_body(doc, deepcopy(_deco_line_element(line)))
+
+_PAGE_BREAK_P = parse_xml('<w:p %s><w:r><w:br w:type="page"/></w:r></w:p>' % nsdecls('w'))
+
+def _add_page_break(doc):
+    """Add a paragraph holding a single page break - a copy of the parsed _PAGE_BREAK_P"""
+    _append_to_body(doc, deepcopy(_PAGE_BREAK_P))
+
 def set_cell_borders(cell):
     """Set clean borders for table cells"""
     try:
@@ -620,24 +863,20 @@ def set_cell_borders(cell):
         tcPr = tc.get_or_add_tcPr()
         
         # Add light borders
-        borders = parse_xml('''
-            <w:tcBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-                <w:top w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>
-                <w:left w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>
-                <w:bottom w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>
-                <w:right w:val="single" w:sz="4" w:space="0" w:color="D0D0D0"/>
-            </w:tcBorders>
-        ''')
-        tcPr.append(borders)
+        tcPr.append(deepcopy(_LIGHT_BORDERS_TEMPLATE))
     except Exception as e:
         print(f"Could not set cell borders: {e}")
 
+@lru_cache(maxsize=32)
+def _shading_element(color_hex):
+    """Parsed <w:shd> element for a fill color - deepcopy it before inserting"""
+    return parse_xml('<w:shd %s w:fill="%s"/>' % (nsdecls('w'), color_hex))
+
 def set_cell_background_color(cell, color_hex):
     """Set cell background color with hex color code"""
     
     try:
-        shading_elm = parse_xml(f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="{color_hex}"/>')
-        cell._tc.get_or_add_tcPr().append(shading_elm)
+        cell._tc.get_or_add_tcPr().append(deepcopy(_shading_element(color_hex)))
     except Exception as e:
         print(f"Could not set cell background color: {e}")
 
@@ -645,60 +884,112 @@ def add_formatted_text_with_bold(paragraph, text, style_name='CleanBody'):
     """Add text with **bold** formatting support"""
     
     try:
-        # Split text by **bold** markers
-        parts = re.split(r'\*\*(.*?)\*\*', text)
+        # Split text by **bold** markers - plain text is a single part
+        parts = _BOLD_RE.split(text) if '**' in text else (text,)
         
         for i, part in enumerate(parts):
             if i % 2 == 0:  # Regular text
                 if part:
-                    run = paragraph.add_run(part)
-                    run.font.name = 'Arial'
-                    run.font.size = Pt(11)
-                    run.font.color.rgb = RGBColor(0, 0, 0)
+                    _styled_run(paragraph, part, 11)
             else:  # Bold text (inside ** **)
-                run = paragraph.add_run(part)
-                run.font.name = 'Arial'
-                run.font.size = Pt(11)
-                run.font.color.rgb = RGBColor(0, 0, 0)
-                run.font.bold = True
+                _styled_run(paragraph, part, 11, bold=True)
         
         paragraph.style = style_name
     
     except Exception as e:
         # Fallback: just add the text normally
-        run = paragraph.add_run(text)
-        run.font.name = 'Arial'
-        run.font.size = Pt(11)
-        run.font.color.rgb = RGBColor(0, 0, 0)
+        _styled_run(paragraph, text, 11)
         paragraph.style = style_name
 
+_BREAK_RE = re.compile(r'(\n|\t)')
+
+def _run_content_xml(text):
+    """Children of a <w:r> holding text; newlines and tabs become w:br / w:tab"""
+    
+    if '\n' not in text and '\t' not in text:
+        if not text:
+            return ''
+        space = ' xml:space="preserve"' if text != text.strip() else ''
+        return '<w:t%s>%s</w:t>' % (space, escape(text))
+    
+    content = []
+    for piece in _BREAK_RE.split(text):
+        if piece == '\n':
+            content.append('<w:br/>')
+        elif piece == '\t':
+            content.append('<w:tab/>')
+        elif piece:
+            space = ' xml:space="preserve"' if piece != piece.strip() else ''
+            content.append('<w:t%s>%s</w:t>' % (space, escape(piece)))
+    return ''.join(content)
+
+@lru_cache(maxsize=None)
+def _run_template(bold, size):
+    """<w:r> XML for an Arial black run with a %s slot for _run_content_xml"""
+    return ('<w:r><w:rPr><w:rFonts w:ascii="Arial" w:hAnsi="Arial"/>%s<w:color w:val="000000"/>'
+            '<w:sz w:val="%d"/></w:rPr>%%s</w:r>' % ('<w:b/>' if bold else '', size * 2))
+
+def _run_xml(text, bold=False, size=11):
+    """<w:r> XML for an Arial black run; newlines and tabs become w:br / w:tab"""
+    return _run_template(bool(bold), size) % _run_content_xml(text)
+
+def _append_p(doc, text, style='CleanBody', indent=None):
+    """
+    Append a body paragraph with **bold** formatting support as a single XML fragment.
+    
+    Same result as add_formatted_text_with_bold() on a new paragraph, without the
+    per-run python-docx property setters. style is a style id (the Clean* style
+    names contain no spaces, so their ids are the names); indent is a left
+    indent in twips.
+    """
+    runs = []
+    for i, part in enumerate(_BOLD_RE.split(text) if '**' in text else (text,)):
+        if i % 2 == 0:  # Regular text
+            if part:
+                runs.append(_run_xml(part))
+        else:  # Bold text (inside ** **)
+            runs.append(_run_xml(part, bold=True))
+    
+    ind = '<w:ind w:left="%d"/>' % indent if indent is not None else ''
+    p = parse_xml('<w:p %s><w:pPr><w:pStyle w:val="%s"/>%s</w:pPr>%s</w:p>'
+                  % (nsdecls('w'), escape(style, {'"': '&quot;'}), ind, ''.join(runs)))
+    return Paragraph(_append_to_body(doc, p), doc._body)
+
+_LIST_P_XML = ('<w:p %s><w:pPr><w:pStyle w:val="CleanBody"/><w:ind w:left="%%d"/></w:pPr>'
+               '<w:r><w:t%%s>%%s</w:t></w:r></w:p>' % nsdecls('w'))
+
+def _append_list_p(doc, text, indent=432):
+    """
+    Append an indented plain CleanBody line (the text summaries' list items) as one
+    parsed fragment instead of add_paragraph + style + paragraph_format setters.
+    indent is in twips - 432 is Inches(0.3).
+    """
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    _append_to_body(doc, parse_xml(_LIST_P_XML % (indent, space, escape(text))))
+
 def add_executive_overview(doc, metrics):
     """Add executive overview section"""
     
     try:
-        header = doc.add_paragraph("EXECUTIVE OVERVIEW")
+        fmt = _formatted_metrics(metrics)
+        
+        header = _add_paragraph(doc, "EXECUTIVE OVERVIEW")
         header.style = 'CleanSectionHeader'
         
         # Add line separator
-        line_para = doc.add_paragraph()
-        line_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        line_run = line_para.add_run("───────────────────────────────────────────────────────────────")
-        line_run.font.name = 'Arial'
-        line_run.font.size = Pt(10)
-        line_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc)
                 
-        overview_text = f"""This comprehensive quality assessment encompasses the systematic evaluation of {metrics.get('total_units', 0):,} residential units within {metrics.get('building_name', 'the building complex')}, conducted on {metrics.get('inspection_date', 'the inspection date')}. This report was compiled on {datetime.now().strftime('%d %B %Y')}.
+        overview_text = f"""This comprehensive quality assessment encompasses the systematic evaluation of {fmt['total_units']} residential units within {metrics.get('building_name', 'the building complex')}, conducted on {metrics.get('inspection_date', 'the inspection date')}. This report was compiled on {fmt['report_date']}.
 
 **Inspection Methodology**: Each unit underwent thorough room-by-room evaluation covering all major building components, including structural elements, mechanical systems, finishes, fixtures, and fittings. The assessment follows industry-standard protocols for pre-settlement quality verification.
 
-**Key Findings**: The inspection revealed {metrics.get('total_defects', 0):,} individual defects across {metrics.get('total_inspections', 0):,} evaluated components, yielding an overall defect rate of {metrics.get('defect_rate', 0):.2f}%. Defect level analysis indicates {metrics.get('ready_pct', 0):.1f}% of units ({metrics.get('ready_units', 0)} units) require only minor work for handover.
+**Key Findings**: The inspection revealed {fmt['total_defects']} individual defects across {fmt['total_inspections']} evaluated components, yielding an overall defect rate of {fmt['defect_rate_2dp']}%. Defect level analysis indicates {fmt['ready_pct']}% of units ({fmt['ready_units']} units) require only minor work for handover.
 
 **Strategic Insights**: The data reveals systematic patterns across trade categories, with concentrated defect types requiring targeted remediation strategies. This analysis enables optimized resource allocation and realistic timeline planning for completion preparation."""
         
-        overview_para = doc.add_paragraph()
-        add_formatted_text_with_bold(overview_para, overview_text)
+        _append_p(doc, overview_text)
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in executive overview: {e}")
@@ -707,22 +998,19 @@ def add_inspection_process(doc, metrics):
     """Add inspection process section"""
     
     try:
-        header = doc.add_paragraph("INSPECTION PROCESS & METHODOLOGY")
+        fmt = _formatted_metrics(metrics)
+        
+        header = _add_paragraph(doc, "INSPECTION PROCESS & METHODOLOGY")
         header.style = 'CleanSectionHeader'
         
         # Decorative line - shortened as requested
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("───────────────────────────────────────────────────────────────")  # Shortened line
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc)
                 
         # Scope section
-        scope_header = doc.add_paragraph("INSPECTION SCOPE & STANDARDS")
+        scope_header = _add_paragraph(doc, "INSPECTION SCOPE & STANDARDS")
         scope_header.style = 'CleanSubsectionHeader'
         
-        scope_text = f"""The comprehensive pre-settlement quality assessment was systematically executed across all {metrics.get('total_units', 0):,} residential units, encompassing detailed evaluation of {metrics.get('total_inspections', 0):,} individual components and building systems.
+        scope_text = f"""The comprehensive pre-settlement quality assessment was systematically executed across all {fmt['total_units']} residential units, encompassing detailed evaluation of {fmt['total_inspections']} individual components and building systems.
 
 **Structural Assessment**
 • Building envelope integrity and weatherproofing
@@ -740,13 +1028,12 @@ def add_inspection_process(doc, metrics):
 • Kitchen and bathroom fixture functionality
 • Built-in storage and joinery craftsmanship"""
         
-        scope_para = doc.add_paragraph()
-        add_formatted_text_with_bold(scope_para, scope_text)
+        _append_p(doc, scope_text)
         
-        doc.add_paragraph()
+        _spacer(doc)
         
         # Quality criteria section
-        criteria_header = doc.add_paragraph("QUALITY ASSESSMENT CRITERIA")
+        criteria_header = _add_paragraph(doc, "QUALITY ASSESSMENT CRITERIA")
         criteria_header.style = 'CleanSubsectionHeader'
         
         criteria_text = """Classification methodology follows systematic evaluation protocols:
@@ -759,13 +1046,12 @@ def add_inspection_process(doc, metrics):
 
 Each assessment point is documented with photographic evidence and detailed descriptions to facilitate efficient remediation workflows."""
         
-        criteria_para = doc.add_paragraph()
-        add_formatted_text_with_bold(criteria_para, criteria_text)
+        _append_p(doc, criteria_text)
         
-        doc.add_paragraph()
+        _spacer(doc)
         
         # Defect level framework section
-        readiness_header = doc.add_paragraph("DEFECT LEVEL FRAMEWORK")
+        readiness_header = _add_paragraph(doc, "DEFECT LEVEL FRAMEWORK")
         readiness_header.style = 'CleanSubsectionHeader'
         
         readiness_text = """Units are categorized using evidence-based defect thresholds and estimated remediation timeframes:
@@ -782,248 +1068,285 @@ Each assessment point is documented with photographic evidence and detailed desc
 **🔴 Extensive Work Required** (15+ defects)
    2-4 weeks estimated timeframe for comprehensive remediation and quality upgrades"""
         
-        readiness_para = doc.add_paragraph()
-        add_formatted_text_with_bold(readiness_para, readiness_text)
+        _append_p(doc, readiness_text)
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in inspection process: {e}")
 
-def add_units_analysis(doc, metrics):
-    """Add units analysis section"""
+def add_units_analysis(doc, metrics, units_chart=None):
+    """Add units analysis section (units_chart: optional Future from _render_units_chart)"""
     
     try:
-        header = doc.add_paragraph("UNITS REQUIRING PRIORITY ATTENTION")
+        header = _add_paragraph(doc, "UNITS REQUIRING PRIORITY ATTENTION")
         header.style = 'CleanSectionHeader'
         
         # Decorative line - shortened as requested
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("───────────────────────────────────────────────────────────────")  # Shortened line
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
-
-        if 'summary_unit' in metrics and len(metrics['summary_unit']) > 0:
+        _add_deco_line(doc)
+
+        if _summary_flags(metrics)['unit']:
             # Create chart
-            create_units_chart(doc, metrics)
+            create_units_chart(doc, metrics, units_chart)
             
             # Analysis text with bold formatting
-            top_unit = metrics['summary_unit'].iloc[0]
+            top_unit_name, top_unit_count = _prepare_report_views(metrics)['top_unit']
+            ready_units, medium_units, high_units, critical_units = _severity_bucket_counts(metrics, _PRIORITY_EDGES)
             
-            summary_text = f"""**Priority Analysis Results**: Unit {top_unit['Unit']} requires immediate priority attention with {top_unit['DefectCount']} identified defects, representing the highest concentration of remediation needs within the development.
+            summary_text = f"""**Priority Analysis Results**: Unit {top_unit_name} requires immediate priority attention with {top_unit_count} identified defects, representing the highest concentration of remediation needs within the development.
 
 **Resource Allocation Framework**:
-• **Critical Priority**: {len(metrics['summary_unit'][metrics['summary_unit']['DefectCount'] > 15])} units requiring extensive remediation (15+ defects each)
-• **High Priority**: {len(metrics['summary_unit'][(metrics['summary_unit']['DefectCount'] > 7) & (metrics['summary_unit']['DefectCount'] <= 15)])} units requiring major work (8-15 defects each)  
-• **Medium Priority**: {len(metrics['summary_unit'][(metrics['summary_unit']['DefectCount'] > 2) & (metrics['summary_unit']['DefectCount'] <= 7)])} units requiring intermediate work (3-7 defects each)
-• **Handover Ready**: {len(metrics['summary_unit'][metrics['summary_unit']['DefectCount'] <= 2])} units ready for immediate handover
+• **Critical Priority**: {critical_units} units requiring extensive remediation (15+ defects each)
+• **High Priority**: {high_units} units requiring major work (8-15 defects each)  
+• **Medium Priority**: {medium_units} units requiring intermediate work (3-7 defects each)
+• **Handover Ready**: {ready_units} units ready for immediate handover
 
 **Strategic Insights**: This distribution pattern enables targeted resource deployment and realistic timeline forecasting for completion preparation activities. The concentration of defects in specific units suggests opportunities for parallel remediation workflows and optimized trade scheduling."""
             
-            summary_para = doc.add_paragraph()
-            add_formatted_text_with_bold(summary_para, summary_text)
+            _append_p(doc, summary_text)
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in units analysis: {e}")
 
-def create_units_chart(doc, metrics):
+def create_units_chart(doc, metrics, chart_future=None):
     """Create units chart with legend"""
     
-    if not MATPLOTLIB_AVAILABLE:
+    if _summary_flags(metrics)['unit_text']:
         add_text_units_summary(doc, metrics)
         return
     
     try:
-        chart_title = doc.add_paragraph("Top 20 Units Requiring Immediate Intervention")
+        chart_title = _add_paragraph(doc, "Top 20 Units Requiring Immediate Intervention")
         chart_title.style = 'CleanSubsectionHeader'
         
-        top_units = metrics['summary_unit'].head(20)
-        
-        if len(top_units) > 0:
-            fig, ax = plt.subplots(figsize=(16, 12))
-            
-            # Color coding based on defect severity
-            colors = []
-            for count in top_units['DefectCount']:
-                if count > 25:
-                    colors.append('#ff9999')  # Light red for critical
-                elif count >= 15:
-                    colors.append('#ffcc99')  # Light orange for extensive
-                elif count >= 8:
-                    colors.append('#ffff99')  # Light yellow for major
-                elif count >= 3:
-                    colors.append('#99ff99')  # Light green for minor
-                else:
-                    colors.append('#99ccff')  # Light blue for ready
-            
-            if NUMPY_AVAILABLE:
-                y_pos = np.arange(len(top_units))
-            else:
-                y_pos = list(range(len(top_units)))
-            
-            bars = ax.barh(y_pos, top_units['DefectCount'], color=colors, alpha=0.8)
-            
-            ax.set_yticks(y_pos)
-            ax.set_yticklabels([f"Unit {unit}" for unit in top_units['Unit']], fontsize=14)
-            ax.set_xlabel('Number of Defects', fontsize=16, fontweight='600')
-            ax.set_title('Units Ranked by Defect Concentration (Priority Order)',
-                        fontsize=18, fontweight='600', pad=25)
-            
-            ax.grid(axis='x', alpha=0.3, linestyle=':')
-            
-            # Value labels
-            for i, (bar, value) in enumerate(zip(bars, top_units['DefectCount'])):
-                ax.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
-                       f'{value}', va='center', fontweight='bold', fontsize=12)
-            
-            # Add legend with proper colors - FIXED
-            from matplotlib.patches import Patch
-            legend_elements = [
-                Patch(facecolor='#ff9999', label='Critical (25+ defects)', alpha=0.8),
-                Patch(facecolor='#ffcc99', label='Extensive (15-24 defects)', alpha=0.8),
-                Patch(facecolor='#ffff99', label='Major (8-14 defects)', alpha=0.8),
-                Patch(facecolor='#99ff99', label='Minor (3-7 defects)', alpha=0.8),
-                Patch(facecolor='#99ccff', label='Ready (0-2 defects)', alpha=0.8)
-            ]
-            ax.legend(handles=legend_elements, loc='upper right', fontsize=14, framealpha=0.9)
-            
-            plt.tight_layout()
-            add_chart_to_document(doc, fig)
-            plt.close()
+        chart_buffer = chart_future.result() if chart_future is not None else _render_units_chart(metrics)
+        if chart_buffer is not None:
+            add_chart_image(doc, chart_buffer)
     
     except Exception as e:
         print(f"Error creating units chart: {e}")
 
+def _classify_severity_loop(counts):
+    """Severity level per defect count: 0 critical (>25), 1 extensive (15+), 2 major (8+), 3 minor (3+), 4 ready"""
+    out = np.empty(counts.shape[0], np.int8)
+    for i in range(counts.shape[0]):
+        c = counts[i]
+        if c > 25:
+            out[i] = 0
+        elif c >= 15:
+            out[i] = 1
+        elif c >= 8:
+            out[i] = 2
+        elif c >= 3:
+            out[i] = 3
+        else:
+            out[i] = 4
+    return out
+
+def _classify_severity_numpy(counts):
+    """Vectorized equivalent of _classify_severity_loop when numba is not installed"""
+    return np.select([counts > 25, counts >= 15, counts >= 8, counts >= 3], [0, 1, 2, 3], 4).astype(np.int8)
+
+@lru_cache(maxsize=32)
+def _opaque_bar_color(hex_color):
+    """
+    '#rrggbb' as it looks drawn at _BAR_ALPHA over white, as an opaque color -
+    same appearance on the white chart background without Agg's alpha blending.
+    """
+    channels = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return '#%02x%02x%02x' % tuple(round(_BAR_ALPHA * c + (1 - _BAR_ALPHA) * 255) for c in channels)
+
+# Indexes into _SEVERITY_COLORS; the loop is JIT-compiled (and cached on disk) when numba is available
+_classify_severity = njit(cache=True)(_classify_severity_loop) if NUMBA_AVAILABLE else _classify_severity_numpy
+
+def _render_units_chart(metrics):
+    """Render the top 20 units chart to a PNG buffer (None when there is no unit data)"""
+    
+    if not _summary_flags(metrics)['unit']:
+        return None
+    
+    views = _prepare_report_views(metrics)
+    unit_counts = views['top_unit_counts']
+    
+    # Color coding based on defect severity
+    critical, extensive, major, minor, ready = _SEVERITY_COLORS
+    colors = [_SEVERITY_COLORS[level] for level in _classify_severity(unit_counts)]
+    
+    value_labels = [f'{value}' for value in unit_counts]
+    
+    if MINIMAL_CHARTS:
+        return render_minimal_barh_png('Units Ranked by Defect Concentration (Priority Order)',
+                                       views['top_unit_labels'], unit_counts, colors, value_labels)
+    
+    fig = _chart_figure(16, 12)
+    ax = fig.subplots()
+    
+    y_pos = _YPOS_CACHE[:len(unit_counts)]
+    
+    bars = ax.barh(y_pos, unit_counts, color=[_opaque_bar_color(color) for color in colors])
+    
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(views['top_unit_labels'], fontsize=14)
+    ax.set_xlabel('Number of Defects', fontsize=16, fontweight='600')
+    ax.set_title('Units Ranked by Defect Concentration (Priority Order)',
+                fontsize=18, fontweight='600', pad=25)
+    
+    ax.grid(axis='x', alpha=0.3, linestyle=':')
+    
+    # Value labels
+    ax.bar_label(bars, labels=value_labels, padding=6, fontweight='bold', fontsize=12)
+    
+    # Add legend with proper colors - FIXED
+    from matplotlib.patches import Patch
+    legend_elements = [
+        Patch(facecolor=_opaque_bar_color(critical), label='Critical (25+ defects)'),
+        Patch(facecolor=_opaque_bar_color(extensive), label='Extensive (15-24 defects)'),
+        Patch(facecolor=_opaque_bar_color(major), label='Major (8-14 defects)'),
+        Patch(facecolor=_opaque_bar_color(minor), label='Minor (3-7 defects)'),
+        Patch(facecolor=_opaque_bar_color(ready), label='Ready (0-2 defects)')
+    ]
+    ax.legend(handles=legend_elements, loc='upper right', fontsize=14, framealpha=0.9)
+    
+    # Fixed margins - tight_layout's text-measuring passes are redundant at a fixed figure size
+    fig.subplots_adjust(left=0.1, right=0.97, top=0.93, bottom=0.07)
+    return render_chart_png(fig)
+
 def add_defects_analysis(doc, processed_data, metrics):
     """Add defects analysis section"""
     
     try:
-        header = doc.add_paragraph("DEFECT PATTERNS & ANALYSIS")
+        header = _add_paragraph(doc, "DEFECT PATTERNS & ANALYSIS")
         header.style = 'CleanSectionHeader'
         
         # Decorative line - shortened as requested
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("───────────────────────────────────────────────────────────────")  # Shortened line
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc)
         
-        doc.add_paragraph()
+        _spacer(doc)
 
-        if 'summary_trade' in metrics and len(metrics['summary_trade']) > 0:
-            top_trade = metrics['summary_trade'].iloc[0]
+        if _summary_flags(metrics)['trade']:
+            top_trade_name, top_trade_count, trade_percentage = _prepare_report_views(metrics)['top_trade']
             total_defects = metrics.get('total_defects', 0)
-            trade_percentage = (top_trade['DefectCount']/total_defects*100) if total_defects > 0 else 0
             
-            defects_text = f"""**Primary Defect Category Analysis**: The comprehensive evaluation of {total_defects:,} individually documented defects reveals "{top_trade['Trade']}" as the dominant concern category, accounting for {top_trade['DefectCount']} instances ({trade_percentage:.1f}% of total defects).
+            defects_text = f"""**Primary Defect Category Analysis**: The comprehensive evaluation of {total_defects:,} individually documented defects reveals "{top_trade_name}" as the dominant concern category, accounting for {top_trade_count} instances ({trade_percentage:.1f}% of total defects).
 
-**Pattern Recognition**: This concentration within the {top_trade['Trade'].lower()} trade category encompasses multiple sub-issues including installation inconsistencies, finish quality variations, functional defects, and compliance gaps. The systematic nature of these defects indicates opportunities for targeted quality control improvements.
+**Pattern Recognition**: This concentration within the {top_trade_name.lower()} trade category encompasses multiple sub-issues including installation inconsistencies, finish quality variations, functional defects, and compliance gaps. The systematic nature of these defects indicates opportunities for targeted quality control improvements.
 
 **Strategic Implications**: The clustering of defects within specific trade categories suggests that focused remediation efforts targeting the top 3-4 trade categories could address approximately 60-80% of all identified issues, enabling efficient resource deployment and accelerated completion timelines."""
             
-            defects_para = doc.add_paragraph()
-            add_formatted_text_with_bold(defects_para, defects_text)
+            _append_p(doc, defects_text)
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in defects analysis: {e}")
 
-def add_data_visualization(doc, processed_data, metrics):
-    """Add data visualization section"""
+def add_data_visualization(doc, processed_data, metrics, trade_chart=None, pie_chart=None, severity_chart=None):
+    """Add data visualization section (*_chart: optional Futures from the matching _render_*_chart)"""
     
     try:
-        header = doc.add_paragraph("COMPREHENSIVE DATA VISUALISATION")
+        header = _add_paragraph(doc, "COMPREHENSIVE DATA VISUALISATION")
         header.style = 'CleanSectionHeader'
         
         # Decorative line - shortened as requested
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("───────────────────────────────────────────────────────────────")  # Shortened line
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc)
 
         intro_text = "This section presents visual analytics of the inspection data, highlighting key patterns and trends to support strategic decision-making and resource allocation."
-        intro_para = doc.add_paragraph(intro_text)
+        intro_para = _add_paragraph(doc, intro_text)
         intro_para.style = 'CleanBody'
         
-        doc.add_paragraph()
+        _spacer(doc)
         
         # Create pie chart
-        create_pie_chart(doc, metrics)
+        create_pie_chart(doc, metrics, pie_chart)
         
         # Create severity chart
-        create_severity_chart(doc, metrics)
+        create_severity_chart(doc, metrics, severity_chart)
         
         # Create trade chart
-        create_trade_chart(doc, metrics)
+        create_trade_chart(doc, metrics, trade_chart)
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in data visualization: {e}")
 
-def create_pie_chart(doc, metrics):
+def create_pie_chart(doc, metrics, chart_future=None):
     """Create pie chart"""
     
-    if not MATPLOTLIB_AVAILABLE:
+    if _summary_flags(metrics)['trade_text']:
         add_text_trade_summary(doc, metrics)
         return
     
     try:
-        if 'summary_trade' not in metrics or len(metrics['summary_trade']) == 0:
+        if not _summary_flags(metrics)['trade']:
             return
         
-        breakdown_header = doc.add_paragraph("Defects Distribution by Trade Category")
+        breakdown_header = _add_paragraph(doc, "Defects Distribution by Trade Category")
         breakdown_header.style = 'CleanSubsectionHeader'
         
-        trade_data = metrics['summary_trade'].copy()
+        trade_data = metrics['summary_trade']
         total_defects = metrics.get('total_defects', 0)
-        
         num_trades = len(trade_data)
         
-        if NUMPY_AVAILABLE and num_trades <= 12:
-            colors = plt.cm.Set3(np.linspace(0, 1, num_trades))
-        else:
-            base_colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', 
-                          '#c2c2f0', '#ffb3e6', '#c4e17f', '#76d7c4', '#f7dc6f']
-            colors = (base_colors * ((num_trades // len(base_colors)) + 1))[:num_trades]
-        
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        wedges, texts, autotexts = ax.pie(
-            trade_data['DefectCount'], 
-            labels=trade_data['Trade'], 
-            colors=colors,
-            autopct='%1.1f%%',
-            startangle=45
-        )
-        
-        ax.set_title(f'Distribution of Defects by Trade Category ({num_trades} Trades)', 
-                    fontsize=16, fontweight='600', pad=20)
-        
-        plt.tight_layout()
-        add_chart_to_document(doc, fig)
-        plt.close()
+        chart_buffer = chart_future.result() if chart_future is not None else _render_pie_chart(metrics)
+        if chart_buffer is not None:
+            add_chart_image(doc, chart_buffer)
         
         # Summary text
         if len(trade_data) > 0:
-            top_trade = trade_data.iloc[0]
-            summary_text = f"""The analysis reveals {top_trade['Trade']} as the primary defect category, representing {top_trade['DefectCount']} of the total {total_defects:,} defects ({top_trade['DefectCount']/total_defects*100:.1f}% of all identified issues). This complete analysis covers all {num_trades} trade categories identified during the inspection, providing comprehensive insights into defect distribution patterns."""
+            top_trade_name, top_trade_count, top_trade_pct = _prepare_report_views(metrics)['top_trade']
+            summary_text = f"""The analysis reveals {top_trade_name} as the primary defect category, representing {top_trade_count} of the total {total_defects:,} defects ({top_trade_pct:.1f}% of all identified issues). This complete analysis covers all {num_trades} trade categories identified during the inspection, providing comprehensive insights into defect distribution patterns."""
             
-            summary_para = doc.add_paragraph(summary_text)
+            summary_para = _add_paragraph(doc, summary_text)
             summary_para.style = 'CleanBody'
     
     except Exception as e:
         print(f"Error creating pie chart: {e}")
 
-def create_severity_chart(doc, metrics):
+def _render_pie_chart(metrics):
+    """Render the defects-by-trade pie chart to a PNG buffer (None when there is no trade data)"""
+    
+    if not _summary_flags(metrics)['trade']:
+        return None
+    
+    trade_data = metrics['summary_trade']
+    num_trades = len(trade_data)
+    
+    colors = _pie_colors(num_trades)
+    
+    fig = _chart_figure(10, 8)
+    ax = fig.subplots()
+    
+    wedges, texts, autotexts = ax.pie(
+        trade_data['DefectCount'], 
+        labels=trade_data['Trade'], 
+        colors=colors,
+        autopct='%1.1f%%',
+        startangle=45
+    )
+    
+    ax.set_title(f'Distribution of Defects by Trade Category ({num_trades} Trades)', 
+                fontsize=16, fontweight='600', pad=20)
+    
+    # Fixed margins with room for the wedge labels instead of a tight_layout pass
+    fig.subplots_adjust(left=0.12, right=0.88, top=0.92, bottom=0.04)
+    return render_chart_png(fig)
+
+@lru_cache(maxsize=16)
+def _pie_colors(num_trades):
+    """
+    Pie wedge colors for num_trades wedges, cached per count: Set3 sampled evenly
+    (up to 12 trades), otherwise the base palette repeated.
+    """
+    if NUMPY_AVAILABLE and num_trades <= 12 and _load_matplotlib():
+        colors = matplotlib.colormaps['Set3'](np.linspace(0, 1, num_trades))
+        colors.setflags(write=False)  # shared between calls
+        return colors
+    return (_PIE_BASE_COLORS * ((num_trades // len(_PIE_BASE_COLORS)) + 1))[:num_trades]
+
+def create_severity_chart(doc, metrics, chart_future=None):
     """Create severity chart"""
     
     if not MATPLOTLIB_AVAILABLE:
@@ -1031,146 +1354,153 @@ def create_severity_chart(doc, metrics):
         return
     
     try:
-        chart_title = doc.add_paragraph("Unit Classification by Defect Severity")
+        chart_title = _add_paragraph(doc, "Unit Classification by Defect Severity")
         chart_title.style = 'CleanSubsectionHeader'
         
-        if 'summary_unit' in metrics and len(metrics['summary_unit']) > 0:
-            fig, ax = plt.subplots(figsize=(12, 7))
-            
-            units_data = metrics['summary_unit']
-            
-            categories = []
-            counts = []
-            colors = []
-            
-            # Calculate categories
-            extensive_count = len(units_data[units_data['DefectCount'] >= 15])
-            categories.append('Extensive\n(15+ defects)')
-            counts.append(extensive_count)
-            colors.append('#ff9999')
-            
-            major_count = len(units_data[(units_data['DefectCount'] >= 8) & (units_data['DefectCount'] <= 14)])
-            categories.append('Major\n(8-14 defects)')
-            counts.append(major_count)
-            colors.append('#ffcc99')
-            
-            minor_count = len(units_data[(units_data['DefectCount'] >= 3) & (units_data['DefectCount'] <= 7)])
-            categories.append('Minor\n(3-7 defects)')
-            counts.append(minor_count)
-            colors.append('#ffff99')
-            
-            ready_count = len(units_data[units_data['DefectCount'] <= 2])
-            categories.append('Ready\n(0-2 defects)')
-            counts.append(ready_count)
-            colors.append('#99ff99')
-            
-            bars = ax.bar(categories, counts, color=colors, alpha=0.8)
-            
-            ax.set_ylabel('Number of Units', fontsize=14, fontweight='600')
-            ax.set_title('Unit Distribution by Defect Severity Level', 
-                        fontsize=16, fontweight='600', pad=20)
-            ax.grid(axis='y', alpha=0.3, linestyle=':')
-            
-            # Value labels
-            for bar, value in zip(bars, counts):
-                if value > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(counts)*0.01,
-                           f'{value}', ha='center', va='bottom', 
-                           fontweight='bold', fontsize=12)
-            
-            plt.tight_layout()
-            add_chart_to_document(doc, fig)
-            plt.close()
+        chart_buffer = chart_future.result() if chart_future is not None else _render_severity_chart(metrics)
+        if chart_buffer is not None:
+            add_chart_image(doc, chart_buffer)
     
     except Exception as e:
         print(f"Error creating severity chart: {e}")
 
-def create_trade_chart(doc, metrics):
+def _render_severity_chart(metrics):
+    """Render the unit severity distribution chart to a PNG buffer (None when there is no unit data)"""
+    
+    if not _summary_flags(metrics)['unit']:
+        return None
+    
+    categories = []
+    counts = []
+    colors = []
+    
+    # Calculate categories
+    ready_count, minor_count, major_count, extensive_count = _severity_bucket_counts(metrics)
+    categories.append('Extensive\n(15+ defects)')
+    counts.append(extensive_count)
+    colors.append('#ff9999')
+    
+    categories.append('Major\n(8-14 defects)')
+    counts.append(major_count)
+    colors.append('#ffcc99')
+    
+    categories.append('Minor\n(3-7 defects)')
+    counts.append(minor_count)
+    colors.append('#ffff99')
+    
+    categories.append('Ready\n(0-2 defects)')
+    counts.append(ready_count)
+    colors.append('#99ff99')
+    
+    if MINIMAL_CHARTS:
+        return render_minimal_barh_png('Unit Distribution by Defect Severity Level',
+                                       [category.replace('\n', ' ') for category in categories],
+                                       counts, colors, [f'{value}' for value in counts])
+    
+    fig = _chart_figure(12, 7)
+    ax = fig.subplots()
+    bars = ax.bar(categories, counts, color=[_opaque_bar_color(color) for color in colors])
+    
+    ax.set_ylabel('Number of Units', fontsize=14, fontweight='600')
+    ax.set_title('Unit Distribution by Defect Severity Level', 
+                fontsize=16, fontweight='600', pad=20)
+    ax.grid(axis='y', alpha=0.3, linestyle=':')
+    
+    # Value labels (empty buckets stay unlabeled)
+    ax.bar_label(bars, labels=[f'{value}' if value > 0 else '' for value in counts],
+                 padding=3, fontweight='bold', fontsize=12)
+    
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.91, bottom=0.1)
+    return render_chart_png(fig)
+
+def create_trade_chart(doc, metrics, chart_future=None):
     """Create trade analysis chart"""
     
-    if not MATPLOTLIB_AVAILABLE:
+    if _summary_flags(metrics)['trade_text']:  # the pie section already wrote the text summary
         return
     
     try:
-        trade_header = doc.add_paragraph("Trade Category Performance Analysis")
+        trade_header = _add_paragraph(doc, "Trade Category Performance Analysis")
         trade_header.style = 'CleanSubsectionHeader'
         
-        if 'summary_trade' not in metrics or len(metrics['summary_trade']) == 0:
+        if not _summary_flags(metrics)['trade']:
             return
         
-        top_trades = metrics['summary_trade'].head(10)
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc'] * 2
-        colors = colors[:len(top_trades)]
-        
-        if NUMPY_AVAILABLE:
-            y_pos = np.arange(len(top_trades))
-        else:
-            y_pos = list(range(len(top_trades)))
-        
-        bars = ax.barh(y_pos, top_trades['DefectCount'], color=colors, alpha=0.8)
-        
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(top_trades['Trade'], fontsize=12)
-        ax.set_xlabel('Number of Defects', fontsize=14, fontweight='600')
-        ax.set_title('Trade Categories Ranked by Defect Frequency', 
-                    fontsize=16, fontweight='600', pad=20)
-        
-        ax.grid(axis='x', alpha=0.3, linestyle=':')
-        
-        # Value labels
-        total_defects = metrics.get('total_defects', 1)
-        for i, (bar, value) in enumerate(zip(bars, top_trades['DefectCount'])):
-            percentage = (value / total_defects * 100) if total_defects > 0 else 0
-            ax.text(bar.get_width() + max(top_trades['DefectCount']) * 0.02, 
-                   bar.get_y() + bar.get_height()/2,
-                   f'{value} ({percentage:.1f}%)', va='center', 
-                   fontweight='600', fontsize=10)
-        
-        plt.tight_layout()
-        add_chart_to_document(doc, fig)
-        plt.close()
+        chart_buffer = chart_future.result() if chart_future is not None else _render_trade_chart(metrics)
+        if chart_buffer is not None:
+            add_chart_image(doc, chart_buffer)
     
     except Exception as e:
         print(f"Error creating trade chart: {e}")
 
+def _render_trade_chart(metrics):
+    """Render the top 10 trades chart to a PNG buffer (None when there is no trade data)"""
+    
+    if not _summary_flags(metrics)['trade']:
+        return None
+    
+    views = _prepare_report_views(metrics)
+    trade_counts = views['top_trade_counts']
+    colors = _TRADE_COLORS[:len(trade_counts)]
+    
+    value_labels = [f'{value} ({percentage:.1f}%)' for value, percentage in zip(trade_counts, views['top_trade_pcts'])]
+    
+    if MINIMAL_CHARTS:
+        return render_minimal_barh_png('Trade Categories Ranked by Defect Frequency',
+                                       views['top_trade_names'], trade_counts, colors, value_labels)
+    
+    fig = _chart_figure(12, 8)
+    ax = fig.subplots()
+    
+    y_pos = _YPOS_CACHE[:len(trade_counts)]
+    
+    bars = ax.barh(y_pos, trade_counts, color=[_opaque_bar_color(color) for color in colors])
+    
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(views['top_trade_names'], fontsize=12)
+    ax.set_xlabel('Number of Defects', fontsize=14, fontweight='600')
+    ax.set_title('Trade Categories Ranked by Defect Frequency', 
+                fontsize=16, fontweight='600', pad=20)
+    
+    ax.grid(axis='x', alpha=0.3, linestyle=':')
+    
+    # Value labels, with x headroom so the widest bars' labels stay inside the figure
+    ax.bar_label(bars, labels=value_labels, padding=6, fontweight='600', fontsize=10)
+    ax.set_xlim(0, trade_counts.max() * 1.18)
+    
+    fig.subplots_adjust(left=0.22, right=0.97, top=0.92, bottom=0.09)
+    return render_chart_png(fig)
+
 def add_trade_summary(doc, processed_data, metrics):
     """Add trade summary section"""
     
     try:
         
-        header = doc.add_paragraph("TRADE-SPECIFIC DEFECT ANALYSIS")
+        header = _add_paragraph(doc, "TRADE-SPECIFIC DEFECT ANALYSIS")
         header.style = 'CleanSectionHeader'
         
         # Decorative line - shortened as requested
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("───────────────────────────────────────────────────────────────")  # Shortened line
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc)
 
         overview_text = """This section provides a comprehensive breakdown of identified defects organized by trade category, including complete unit inventories for targeted remediation planning and resource allocation optimization."""
         
-        overview_para = doc.add_paragraph(overview_text)
+        overview_para = _add_paragraph(doc, overview_text)
         overview_para.style = 'CleanBody'
                 
         if processed_data is not None and len(processed_data) > 0:
             try:
-                component_details = generate_complete_component_details(processed_data)
+                component_details = generate_complete_component_details(processed_data, metrics)
                 add_trade_tables(doc, component_details)
             except Exception as e:
                 print(f"Error generating trade tables: {e}")
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in trade summary: {e}")
 
-def generate_complete_component_details(processed_data):
-    """Generate component details for trade analysis"""
+def generate_complete_component_details(processed_data, metrics=None):
+    """Generate component details for trade analysis (metrics: optional per-report cache for the defect rows)"""
     
     try:
         required_columns = ['StatusClass', 'Trade', 'Room', 'Component', 'Unit']
@@ -1180,21 +1510,19 @@ def generate_complete_component_details(processed_data):
             print(f"Missing columns: {missing_columns}")
             return pd.DataFrame()
         
-        defects_only = processed_data[processed_data['StatusClass'] == 'Not OK']
+        defects_only = _defects_only(processed_data, metrics)
         
         if len(defects_only) == 0:
             return pd.DataFrame()
         
-        component_summary = defects_only.groupby(['Trade', 'Room', 'Component']).agg({
-            'Unit': lambda x: ', '.join(sorted(x.astype(str).unique()))
+        # Stringify and sort the units once so each group's unique() is already in order,
+        # then build both aggregates in a single groupby
+        defects_only = defects_only.assign(Unit_Str=defects_only['Unit'].astype(str)).sort_values('Unit_Str', kind='stable')
+        component_summary = defects_only.groupby(['Trade', 'Room', 'Component']).agg(**{
+            'Affected Units': ('Unit_Str', lambda x: ', '.join(x.unique())),
+            'Unit Count': ('Unit', 'nunique')
         }).reset_index()
         
-        component_summary.columns = ['Trade', 'Room', 'Component', 'Affected Units']
-        
-        unit_counts = defects_only.groupby(['Trade', 'Room', 'Component'])['Unit'].nunique().reset_index()
-        component_summary = component_summary.merge(unit_counts, on=['Trade', 'Room', 'Component'])
-        component_summary.columns = ['Trade', 'Room', 'Component', 'Affected Units', 'Unit Count']
-        
         component_summary = component_summary.sort_values(['Trade', 'Unit Count'], ascending=[True, False])
         
         return component_summary
@@ -1203,6 +1531,92 @@ def generate_complete_component_details(processed_data):
         print(f"Error generating component details: {e}")
         return pd.DataFrame()
 
+_TRADE_COL_WIDTHS = (3600, 5760, 1152)  # twips: 2.5", 4.0", 0.8"
+_COMPONENT_COL_WIDTHS = (2880, 2592, 3600, 1152, 1440)  # twips: 2.0", 1.8", 2.5", 0.8", 1.0"
+
+# Data row cells as (width in twips, bold, point size, centered) for _row_template
+_TRADE_ROW_CELLS = tuple(zip(_TRADE_COL_WIDTHS, (False, False, True), (10, 10, 10), (False, False, True)))
+_COMPONENT_ROW_CELLS = tuple(zip(_COMPONENT_COL_WIDTHS, (False, False, False, True, True),
+                                 (10, 10, 9, 10, 10), (False, False, False, True, True)))
+_ROW_FILLS = ("FFFFFF", "F8F8F8")  # alternating data row shading, by row index parity
+
+@lru_cache(maxsize=None)
+def _shaded_cell_template(width, fill, bold, size, center):
+    """One shaded <w:tc> of a report table with a %s slot for _run_content_xml"""
+    return ('<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="%d"/><w:shd w:fill="%s"/></w:tcPr><w:p>%s%s</w:p></w:tc>'
+            % (width, fill, '<w:pPr><w:jc w:val="center"/></w:pPr>' if center else '', _run_template(bold, size)))
+
+def _shaded_cell_xml(width, fill, text, bold=False, size=10, center=False):
+    """One shaded <w:tc> of a report table"""
+    return _shaded_cell_template(width, fill, bold, size, center) % _run_content_xml(text)
+
+@lru_cache(maxsize=16)
+def _row_template(cells, fill):
+    """
+    <w:tr> XML for one data row with every cell shaded fill, with one %s slot per
+    cell for _run_content_xml - rows are then a single string format each.
+    """
+    return '<w:tr>%s</w:tr>' % ''.join(
+        _shaded_cell_template(width, fill, bold, size, center) for width, bold, size, center in cells
+    )
+
+@lru_cache(maxsize=8)
+def _header_row_xml(headers, width):
+    """Gray, bold, centered header <w:tr> with equal cell widths in twips"""
+    return '<w:tr>%s</w:tr>' % ''.join(
+        _shaded_cell_xml(width, 'F0F0F0', header, bold=True, size=11, center=True) for header in headers
+    )
+
+def _build_trade_tbl_xml(trade_data, header_width):
+    """
+    Return the <w:tbl> XML for one trade: a shaded header row and one row per
+    component with alternating white / light gray shading. header_width is the
+    header cell width in twips (the default equal split of the page width).
+    """
+    rows = [_header_row_xml(('Component & Location', 'Affected Units', 'Count'), header_width)]
+    
+    columns = trade_data[['Component', 'Room', 'Affected Units', 'Unit Count']]
+    for idx, (component, room, affected_units, unit_count) in enumerate(columns.itertuples(index=False, name=None)):
+        component_location = str(component)
+        if pd.notna(room) and str(room).strip():
+            component_location += f" ({room})"
+        
+        # Alternating row colors (white and light gray)
+        rows.append(_row_template(_TRADE_ROW_CELLS, _ROW_FILLS[idx % 2]) % (
+            _run_content_xml(component_location),
+            _run_content_xml(str(affected_units)),
+            _run_content_xml(str(unit_count)),
+        ))
+    
+    return _tbl_xml(_TRADE_COL_WIDTHS, rows)
+
+def _tbl_xml(col_widths, rows):
+    """<w:tbl> XML for a 'Table Grid' table with the given column widths (twips) and <w:tr> strings"""
+    return ('<w:tbl %s><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+            '</w:tblPr><w:tblGrid>%s</w:tblGrid>%s</w:tbl>'
+            % (nsdecls('w'), ''.join('<w:gridCol w:w="%d"/>' % w for w in col_widths), ''.join(rows)))
+
+def _build_component_tbl_xml(top_components, pct_labels, header_width):
+    """
+    Return the <w:tbl> XML for the most frequently affected components: a shaded
+    header row and one alternating white / light gray row per component.
+    """
+    rows = [_header_row_xml(('Component', 'Trade', 'Sample Affected Units', 'Total Count', 'Percentage'), header_width)]
+    
+    columns = top_components[['Component', 'Trade', 'Sample_Units_Display', 'Total_Unique_Units']]
+    for idx, (component, trade, sample_units, unit_count) in enumerate(columns.itertuples(index=False, name=None)):
+        # Alternating row colors; FIXED: Use Total_Unique_Units instead of Unit_Count
+        rows.append(_row_template(_COMPONENT_ROW_CELLS, _ROW_FILLS[idx % 2]) % (
+            _run_content_xml(str(component)),
+            _run_content_xml(str(trade)),
+            _run_content_xml(str(sample_units)),
+            _run_content_xml(str(unit_count)),
+            _run_content_xml(pct_labels[idx]),
+        ))
+    
+    return _tbl_xml(_COMPONENT_COL_WIDTHS, rows)
+
 def add_trade_tables(doc, component_details):
     """Add trade tables with clean formatting and shading"""
     
@@ -1216,70 +1630,14 @@ def add_trade_tables(doc, component_details):
             try:
                 trade_data = component_details[component_details['Trade'] == trade]
                 
-                trade_header = doc.add_paragraph(f"{trade}")
+                trade_header = _add_paragraph(doc, f"{trade}")
                 trade_header.style = 'CleanSubsectionHeader'
                 
-                table = doc.add_table(rows=1, cols=3)
-                table.style = 'Table Grid'
-                
-                table.columns[0].width = Inches(2.5)
-                table.columns[1].width = Inches(4.0)
-                table.columns[2].width = Inches(0.8)
-                
-                # Headers with shading
-                headers = ['Component & Location', 'Affected Units', 'Count']
-                for i, header in enumerate(headers):
-                    cell = table.cell(0, i)
-                    cell.text = header
-                    para = cell.paragraphs[0]
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    run = para.runs[0]
-                    run.font.bold = True
-                    run.font.name = 'Arial'
-                    run.font.size = Pt(11)
-                    run.font.color.rgb = RGBColor(0, 0, 0)
-                    
-                    # Add header shading (light gray)
-                    set_cell_background_color(cell, "F0F0F0")
-                
-                # Add alternating row shading
-                for idx, (_, row) in enumerate(trade_data.iterrows()):
-                    table_row = table.add_row()
-                    
-                    # Set alternating row colors (white and light gray)
-                    row_color = "FFFFFF" if idx % 2 == 0 else "F8F8F8"
-                    
-                    component_location = str(row['Component'])
-                    if pd.notna(row['Room']) and str(row['Room']).strip():
-                        component_location += f" ({row['Room']})"
-                    
-                    # Component & Location cell
-                    cell1 = table_row.cells[0]
-                    cell1.text = component_location
-                    cell1.paragraphs[0].runs[0].font.name = 'Arial'
-                    cell1.paragraphs[0].runs[0].font.size = Pt(10)
-                    cell1.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                    set_cell_background_color(cell1, row_color)
-                    
-                    # Affected Units cell
-                    cell2 = table_row.cells[1]
-                    cell2.text = str(row['Affected Units'])
-                    cell2.paragraphs[0].runs[0].font.name = 'Arial'
-                    cell2.paragraphs[0].runs[0].font.size = Pt(10)
-                    cell2.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                    set_cell_background_color(cell2, row_color)
-                    
-                    # Count cell
-                    cell3 = table_row.cells[2]
-                    cell3.text = str(row['Unit Count'])
-                    cell3.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    cell3.paragraphs[0].runs[0].font.name = 'Arial'
-                    cell3.paragraphs[0].runs[0].font.size = Pt(10)
-                    cell3.paragraphs[0].runs[0].font.bold = True
-                    cell3.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                    set_cell_background_color(cell3, row_color)
+                # One XML string per trade table, parsed once
+                header_width = int(doc._block_width / 3) // 635
+                _append_to_body(doc, parse_xml(_build_trade_tbl_xml(trade_data, header_width)))
                 
-                doc.add_paragraph()
+                _spacer(doc)
             
             except Exception as e:
                 print(f"Error processing trade {trade}: {e}")
@@ -1292,40 +1650,26 @@ def add_component_breakdown(doc, processed_data, metrics):
     """Add component breakdown analysis - FIXED VERSION"""
     
     try:
-        header = doc.add_paragraph("COMPONENT-LEVEL ANALYSIS")
+        header = _add_paragraph(doc, "COMPONENT-LEVEL ANALYSIS")
         header.style = 'CleanSectionHeader'
         
         # Decorative line
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("─────────────────────────────────────────────────────────────────")
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc, _SEP_WIDE)
  
         intro_text = "This analysis identifies the most frequently affected individual components across all units, enabling targeted quality control improvements and preventive measures for future construction phases."
         
-        intro_para = doc.add_paragraph(intro_text)
+        intro_para = _add_paragraph(doc, intro_text)
         intro_para.style = 'CleanBody'
         
-        doc.add_paragraph()
+        _spacer(doc)
         
         if processed_data is not None and len(processed_data) > 0:
             # FIXED: Generate component breakdown properly
-            component_data = generate_fixed_component_breakdown(processed_data)
+            component_data = generate_fixed_component_breakdown(processed_data, metrics)
             
             if len(component_data) > 0:
                 # FIXED: Proper aggregation by Component + Trade combination
-                component_aggregated = component_data.groupby(['Component', 'Trade']).agg({
-                    'Unit_Count': 'sum',  # Sum the unit counts for each component
-                    'Affected_Units': lambda x: list(set([unit for units_str in x for unit in units_str.split(', ') if units_str.strip()]))  # Combine all unique units
-                }).reset_index()
-                
-                # Convert the list back to comma-separated string and count unique units
-                component_aggregated['Total_Unique_Units'] = component_aggregated['Affected_Units'].apply(len)
-                component_aggregated['Sample_Units_Display'] = component_aggregated['Affected_Units'].apply(
-                    lambda units_list: ', '.join(sorted(units_list[:5]) + ([f'(+{len(units_list)-5} more)'] if len(units_list) > 5 else []))
-                )
+                component_aggregated = _aggregate_component_units(component_data)
                 
                 # Sort by total unique units affected (descending)
                 top_components = component_aggregated.nlargest(15, 'Total_Unique_Units')
@@ -1336,116 +1680,84 @@ def add_component_breakdown(doc, processed_data, metrics):
                 else:
                     top_components = top_components.head(10)
                 
-                most_freq_header = doc.add_paragraph("Most Frequently Affected Components")
+                most_freq_header = _add_paragraph(doc, "Most Frequently Affected Components")
                 most_freq_header.style = 'CleanSubsectionHeader'
                 
                 if len(top_components) > 0:
-                    comp_table = doc.add_table(rows=1, cols=5)
-                    comp_table.style = 'Table Grid'
+                    total_units = metrics.get('total_units', 1)
                     
-                    comp_table.columns[0].width = Inches(2.0)
-                    comp_table.columns[1].width = Inches(1.8)
-                    comp_table.columns[2].width = Inches(2.5)
-                    comp_table.columns[3].width = Inches(0.8)
-                    comp_table.columns[4].width = Inches(1.0)
+                    # FIXED: Calculate percentages correctly using unique units - all rows at once
+                    unit_counts = top_components['Total_Unique_Units'].to_numpy()
+                    unit_pcts = unit_counts / total_units * 100 if total_units > 0 else np.zeros(len(unit_counts))
+                    pct_labels = [f"{percentage:.1f}%" for percentage in unit_pcts]
                     
-                    # Headers with bold formatting
-                    headers = ['Component', 'Trade', 'Sample Affected Units', 'Total Count', 'Percentage']
-                    for i, header in enumerate(headers):
-                        cell = comp_table.cell(0, i)
-                        cell.text = header
-                        para = cell.paragraphs[0]
-                        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        run = para.runs[0]
-                        run.font.bold = True
-                        run.font.name = 'Arial'
-                        run.font.size = Pt(11)
-                        run.font.color.rgb = RGBColor(0, 0, 0)
-                        
-                        # Add header shading
-                        set_cell_background_color(cell, "F0F0F0")
+                    # Whole table as one XML string, parsed once (no add_row per component)
+                    header_width = int(doc._block_width / 5) // 635
+                    _append_to_body(doc, parse_xml(_build_component_tbl_xml(top_components, pct_labels, header_width)))
                     
-                    total_units = metrics.get('total_units', 1)
-                    for idx, (_, comp_row) in enumerate(top_components.iterrows()):
-                        row = comp_table.add_row()
-                        
-                        # Alternating row colors
-                        row_color = "FFFFFF" if idx % 2 == 0 else "F8F8F8"
-                        
-                        # Component
-                        cell1 = row.cells[0]
-                        cell1.text = str(comp_row.get('Component', 'N/A'))
-                        cell1.paragraphs[0].runs[0].font.name = 'Arial'
-                        cell1.paragraphs[0].runs[0].font.size = Pt(10)
-                        cell1.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                        set_cell_background_color(cell1, row_color)
-                        
-                        # Trade
-                        cell2 = row.cells[1]
-                        cell2.text = str(comp_row.get('Trade', 'N/A'))
-                        cell2.paragraphs[0].runs[0].font.name = 'Arial'
-                        cell2.paragraphs[0].runs[0].font.size = Pt(10)
-                        cell2.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                        set_cell_background_color(cell2, row_color)
-                        
-                        # Sample affected units
-                        cell3 = row.cells[2]
-                        cell3.text = str(comp_row.get('Sample_Units_Display', ''))
-                        cell3.paragraphs[0].runs[0].font.name = 'Arial'
-                        cell3.paragraphs[0].runs[0].font.size = Pt(9)
-                        cell3.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                        set_cell_background_color(cell3, row_color)
-                        
-                        # FIXED: Use Total_Unique_Units instead of Unit_Count
-                        cell4 = row.cells[3]
-                        unit_count = comp_row.get('Total_Unique_Units', 0)
-                        cell4.text = str(unit_count)
-                        cell4.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        cell4.paragraphs[0].runs[0].font.name = 'Arial'
-                        cell4.paragraphs[0].runs[0].font.size = Pt(10)
-                        cell4.paragraphs[0].runs[0].font.bold = True
-                        cell4.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                        set_cell_background_color(cell4, row_color)
-                        
-                        # FIXED: Calculate percentage correctly using unique units
-                        cell5 = row.cells[4]
-                        percentage = (unit_count / total_units * 100) if total_units > 0 else 0
-                        cell5.text = f"{percentage:.1f}%"
-                        cell5.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        cell5.paragraphs[0].runs[0].font.name = 'Arial'
-                        cell5.paragraphs[0].runs[0].font.size = Pt(10)
-                        cell5.paragraphs[0].runs[0].font.bold = True
-                        cell5.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 0)
-                        set_cell_background_color(cell5, row_color)
+                    # Analysis text with proper bold formatting - top_components is non-empty here
+                    component_name, trade_name = top_components['Component'].iat[0], top_components['Trade'].iat[0]
+                    top_five_units = int(unit_counts[:5].sum())
                     
-                    # Analysis text with proper bold formatting
-                    if len(top_components) > 0:
-                        top_component = top_components.iloc[0]
-                        unit_count = top_component.get('Total_Unique_Units', 0)
-                        component_name = top_component.get('Component', 'Unknown')
-                        trade_name = top_component.get('Trade', 'Unknown')
-                        
-                        doc.add_paragraph()
-                        
-                        analysis_text = f"""**Component Analysis Insights**: "{component_name}" emerges as the most frequently affected component, impacting {unit_count} units ({unit_count/total_units*100:.1f}% of all inspected units). This pattern reveals a systematic issue requiring immediate attention within the {trade_name} trade category.
+                    _spacer(doc)
+                    
+                    analysis_text = f"""**Component Analysis Insights**: "{component_name}" emerges as the most frequently affected component, impacting {unit_counts[0]} units ({pct_labels[0]} of all inspected units). This pattern reveals a systematic issue requiring immediate attention within the {trade_name} trade category.
 
 **Key Findings from Component Analysis**:
-• The top 5 most problematic components collectively affect {top_components.head(5)['Total_Unique_Units'].sum()} units across the development
+• The top 5 most problematic components collectively affect {top_five_units} units across the development
 • {trade_name} trade demonstrates the highest frequency of component-specific defects
 • Recurring component failures across multiple units indicate potential systematic installation or quality control issues
 • Component-level patterns suggest opportunities for targeted supplier quality improvements"""
-                        
-                        analysis_para = doc.add_paragraph()
-                        add_formatted_text_with_bold(analysis_para, analysis_text)
+                    
+                    _append_p(doc, analysis_text)
         
-        doc.add_page_break()
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in component breakdown: {e}")
 
 
-def generate_fixed_component_breakdown(processed_data):
-    """FIXED: Generate component details that match Excel report logic"""
+def _aggregate_component_units(component_data):
+    """
+    Combine the per-room component rows into one row per Component + Trade with
+    the summed Unit_Count, the number of unique affected units and a sample
+    display of the first 5 units (sorted) plus a "(+N more)" suffix.
+    
+    Works on the integer Unit_Codes from generate_fixed_component_breakdown, so
+    units are deduplicated and sorted as codes and only the sample is turned
+    back into strings.
+    """
+    keys = ['Component', 'Trade']
+    component_aggregated = component_data.groupby(keys)[['Unit_Count']].sum()
+    
+    # One row per unique (Component, Trade, unit code), sorted by code (= unit order)
+    with_units = component_data[component_data['Affected_Units'].str.strip() != '']
+    unit_codes = with_units['Unit_Codes'].to_numpy()
+    lengths = np.fromiter(map(len, unit_codes), dtype=np.int64, count=len(unit_codes))
+    units = pd.DataFrame({
+        'Component': np.repeat(with_units['Component'].to_numpy(), lengths),
+        'Trade': np.repeat(with_units['Trade'].to_numpy(), lengths),
+        'Unit': np.concatenate(unit_codes) if len(unit_codes) else np.empty(0, dtype=np.int64),
+    }).drop_duplicates().sort_values('Unit', kind='stable')
+    
+    total_unique = units.groupby(keys).size()
+    sample = units.groupby(keys).head(5)
+    unit_names = np.asarray(component_data.attrs['unit_categories'], dtype=object)
+    sample_units = sample.assign(Unit=unit_names[sample['Unit'].to_numpy()]).groupby(keys)['Unit'].agg(', '.join)
+    
+    total_unique = total_unique.reindex(component_aggregated.index, fill_value=0)
+    component_aggregated['Total_Unique_Units'] = total_unique
+    
+    # Sample plus "(+N more)" suffix, formatted in a single pass
+    component_aggregated['Sample_Units_Display'] = [
+        f'{head}, (+{total - 5} more)' if total > 5 else head
+        for head, total in zip(sample_units.reindex(component_aggregated.index, fill_value=''), total_unique)
+    ]
+    
+    return component_aggregated.reset_index()
+
+def generate_fixed_component_breakdown(processed_data, metrics=None):
+    """FIXED: Generate component details that match Excel report logic (metrics: optional per-report cache)"""
     
     try:
         required_columns = ['StatusClass', 'Trade', 'Room', 'Component', 'Unit']
@@ -1456,25 +1768,38 @@ def generate_fixed_component_breakdown(processed_data):
             return pd.DataFrame()
         
         # Filter for defects only
-        defects_only = processed_data[processed_data['StatusClass'] == 'Not OK']
+        defects_only = _defects_only(processed_data, metrics)
         
-        if len(defects_only) == 0:
+        if len(defects_only) == 0 or not defects_only['Component'].notna().any():
             return pd.DataFrame()
         
+        # Units as categorical codes: categories are the sorted unit strings, so
+        # sorting codes sorts units and each unit string exists only once
+        units = pd.Categorical(defects_only['Unit'].astype(str))
+        unit_names = np.asarray(units.categories, dtype=object)
+        
         # FIXED: Group by Component, Trade, Room combination (matching Excel logic)
-        component_summary = defects_only.groupby(['Component', 'Trade', 'Room']).agg({
-            'Unit': lambda x: ', '.join(sorted(x.astype(str).unique()))  # Get unique units as comma-separated string
-        }).reset_index()
+        grouped = defects_only.groupby(['Component', 'Trade', 'Room'])
         
         # Count unique units per component/trade/room combination
-        unit_counts = defects_only.groupby(['Component', 'Trade', 'Room'])['Unit'].nunique().reset_index()
+        component_summary = grouped['Unit'].nunique().rename('Unit_Count').reset_index()
+        
+        # Sorted unique unit codes per group: one np.unique over a combined
+        # (group number, unit code) key, sliced at the group boundaries
+        group_ids = grouped.ngroup().to_numpy()
+        coded_rows = (group_ids >= 0) & (units.codes >= 0)  # skip rows with a missing key or unit
+        pairs = np.unique(group_ids[coded_rows].astype(np.int64) * len(unit_names) + units.codes[coded_rows])
+        pair_groups, pair_codes = np.divmod(pairs, len(unit_names))
+        bounds = np.searchsorted(pair_groups, np.arange(grouped.ngroups + 1))
+        unit_codes = [pair_codes[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
         
-        # Merge the data
-        component_summary = component_summary.merge(unit_counts, on=['Component', 'Trade', 'Room'])
-        component_summary.columns = ['Component', 'Trade', 'Room', 'Affected_Units', 'Unit_Count']
+        # Unique units as comma-separated string
+        component_summary.insert(3, 'Affected_Units', [', '.join(unit_names[codes]) for codes in unit_codes])
+        component_summary['Unit_Codes'] = unit_codes
         
         # Sort by unit count (descending), then by component name
         component_summary = component_summary.sort_values(['Unit_Count', 'Component'], ascending=[False, True])
+        component_summary.attrs['unit_categories'] = tuple(unit_names)  # a tuple: pandas compares attrs with == when combining frames
         
         print(f"Generated component breakdown with {len(component_summary)} entries")
         return component_summary
@@ -1487,36 +1812,29 @@ def add_recommendations(doc, metrics):
     """Add recommendations section"""
     
     try:
-        header = doc.add_paragraph("STRATEGIC RECOMMENDATIONS & ACTION PLAN")
+        header = _add_paragraph(doc, "STRATEGIC RECOMMENDATIONS & ACTION PLAN")
         header.style = 'CleanSectionHeader'
         
         # Decorative line - shortened as requested
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("───────────────────────────────────────────────────────────────")  # Shortened line
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc)
                 
         # Immediate priorities
-        priorities_header = doc.add_paragraph("IMMEDIATE PRIORITIES")
+        priorities_header = _add_paragraph(doc, "IMMEDIATE PRIORITIES")
         priorities_header.style = 'CleanSubsectionHeader'
         
-        priorities = []
         ready_pct = metrics.get('ready_pct', 0)
         extensive_units = metrics.get('extensive_work_units', 0)
         
         if ready_pct > 75:
-            priorities.append("**Accelerated Completion Protocol**: With 75%+ units requiring only minor work, implement immediate handover for compliant units while establishing parallel remediation workflows for remaining inventory.")
+            priorities = ["**Accelerated Completion Protocol**: With 75%+ units requiring only minor work, implement immediate handover for compliant units while establishing parallel remediation workflows for remaining inventory."]
         elif ready_pct > 50:
-            priorities.append("**Phased Completion Strategy**: Establish structured completion phases prioritizing ready units first, with clear milestone-based progression for units under remediation.")
+            priorities = ["**Phased Completion Strategy**: Establish structured completion phases prioritizing ready units first, with clear milestone-based progression for units under remediation."]
         else:
-            priorities.append("**Quality-First Approach**: Implement comprehensive remediation program before handover to ensure optimal customer satisfaction and minimize post-handover defect claims.")
+            priorities = ["**Quality-First Approach**: Implement comprehensive remediation program before handover to ensure optimal customer satisfaction and minimize post-handover defect claims."]
         
-        if 'summary_trade' in metrics and len(metrics['summary_trade']) > 0:
-            top_trade = metrics['summary_trade'].iloc[0]
-            top_trade_pct = (top_trade['DefectCount'] / metrics.get('total_defects', 1) * 100)
-            priorities.append(f"**{top_trade['Trade']} Focus Initiative**: This trade represents {top_trade_pct:.1f}% of all defects ({top_trade['DefectCount']} instances). Deploy dedicated supervision teams and additional resources with daily progress monitoring.")
+        if _summary_flags(metrics)['trade']:
+            top_trade_name, top_trade_count, top_trade_pct = _prepare_report_views(metrics)['top_trade']
+            priorities.append(f"**{top_trade_name} Focus Initiative**: This trade represents {top_trade_pct:.1f}% of all defects ({top_trade_count} instances). Deploy dedicated supervision teams and additional resources with daily progress monitoring.")
         
         if extensive_units > 0:
             priorities.append(f"**Specialized Remediation Teams**: {extensive_units} units require extensive work (15+ defects each). Establish dedicated teams with enhanced supervision to maintain project timeline integrity and quality standards.")
@@ -1524,86 +1842,78 @@ def add_recommendations(doc, metrics):
         priorities.append("**Enhanced Quality Protocols**: Implement multi-tier inspection checkpoints with supervisor sign-offs for critical trades before final handover, reducing post-handover callback rates.")
         
         for i, priority in enumerate(priorities, 1):
-            priority_para = doc.add_paragraph()
-            add_formatted_text_with_bold(priority_para, f"{i}. {priority}")
-            priority_para.paragraph_format.left_indent = Inches(0.4)
+            _append_p(doc, f"{i}. {priority}", indent=576)  # Inches(0.4)
         
-        doc.add_paragraph()
-        doc.add_page_break()
+        _spacer(doc)
+        _add_page_break(doc)
     
     except Exception as e:
         print(f"Error in recommendations: {e}")
 
+# Static tail of the footer's report-generation block
+_FOOTER_RESOURCES_TEXT = """**COMPANION DOCUMENTATION SUITE**:
+Complete defect inventories, unit-by-unit detailed breakdowns, interactive filterable data tables, and comprehensive photographic documentation are available in the accompanying Excel analytics workbook. This comprehensive dataset includes advanced filtering capabilities, dynamic visual dashboards, pivot table analysis tools, and direct export functionality for integration with project management systems and remediation tracking platforms.
+
+**TECHNICAL SUPPORT & FOLLOW-UP**:
+For technical inquiries, data interpretation assistance, or additional analysis requirements, please contact the inspection team. Ongoing support is available for remediation planning, progress tracking, and post-completion verification inspections."""
+
 def add_footer(doc, metrics):
     """Add footer section"""
     
     try:
-        header = doc.add_paragraph("REPORT DOCUMENTATION & APPENDICES")
+        fmt = _formatted_metrics(metrics)
+        
+        header = _add_paragraph(doc, "REPORT DOCUMENTATION & APPENDICES")
         header.style = 'CleanSectionHeader'
         
         # Decorative line - shortened as requested
-        deco_para = doc.add_paragraph()
-        deco_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        deco_run = deco_para.add_run("───────────────────────────────────────────────────────────────")  # Shortened line
-        deco_run.font.name = 'Arial'
-        deco_run.font.size = Pt(10)
-        deco_run.font.color.rgb = RGBColor(0, 0, 0)
+        _add_deco_line(doc)
 
         # Comprehensive inspection metrics
-        data_summary_header = doc.add_paragraph("COMPREHENSIVE INSPECTION METRICS")
+        data_summary_header = _add_paragraph(doc, "COMPREHENSIVE INSPECTION METRICS")
         data_summary_header.style = 'CleanSubsectionHeader'
         
-        avg_defects = metrics.get('avg_defects_per_unit', 0)
-        defect_rate = metrics.get('defect_rate', 0)
-        quality_score = max(0, 100 - defect_rate)
-        
-        data_summary_text = f"""**INSPECTION SCOPE & RESULTS**:
-• Total Residential Units Evaluated: {metrics.get('total_units', 0):,}
-• Total Building Components Assessed: {metrics.get('total_inspections', 0):,}
-• Total Defects Documented: {metrics.get('total_defects', 0):,}
-• Overall Defect Rate: {metrics.get('defect_rate', 0):.2f}%
-• Average Defects per Unit: {avg_defects:.2f}
-• Development Quality Score: {quality_score:.1f}/100
-
-**DEFECT LEVEL FRAMEWORK DISTRIBUTION**:
-• Minor Work Required: {metrics.get('ready_units', 0)} units ({metrics.get('ready_pct', 0):.1f}%)
-• Intermediate Remediation Required: {metrics.get('minor_work_units', 0)} units ({metrics.get('minor_pct', 0):.1f}%)
-• Major Remediation Required: {metrics.get('major_work_units', 0)} units ({metrics.get('major_pct', 0):.1f}%)  
-• Extensive Remediation Required: {metrics.get('extensive_work_units', 0)} units ({metrics.get('extensive_pct', 0):.1f}%)"""
-        
-        data_summary_para = doc.add_paragraph()
-        add_formatted_text_with_bold(data_summary_para, data_summary_text)
-        
-        doc.add_paragraph()
+        data_summary_text = "\n".join([
+            "**INSPECTION SCOPE & RESULTS**:",
+            f"• Total Residential Units Evaluated: {fmt['total_units']}",
+            f"• Total Building Components Assessed: {fmt['total_inspections']}",
+            f"• Total Defects Documented: {fmt['total_defects']}",
+            f"• Overall Defect Rate: {fmt['defect_rate_2dp']}%",
+            f"• Average Defects per Unit: {fmt['avg_defects_per_unit']}",
+            f"• Development Quality Score: {fmt['quality_score']}/100",
+            "",
+            "**DEFECT LEVEL FRAMEWORK DISTRIBUTION**:",
+            f"• Minor Work Required: {fmt['ready_units']} units ({fmt['ready_pct']}%)",
+            f"• Intermediate Remediation Required: {fmt['minor_work_units']} units ({fmt['minor_pct']}%)",
+            f"• Major Remediation Required: {fmt['major_work_units']} units ({fmt['major_pct']}%)  ",
+            f"• Extensive Remediation Required: {fmt['extensive_work_units']} units ({fmt['extensive_pct']}%)",
+        ])
+        
+        _append_p(doc, data_summary_text)
+        
+        _spacer(doc)
         
         # Report generation details
-        details_header = doc.add_paragraph("REPORT GENERATION & COMPANION RESOURCES")
+        details_header = _add_paragraph(doc, "REPORT GENERATION & COMPANION RESOURCES")
         details_header.style = 'CleanSubsectionHeader'
         
-        details_text = f"""**REPORT METADATA**:
-• Report Generated: {datetime.now().strftime('%d %B %Y at %I:%M %p')}
-• Inspection Completion: {metrics.get('inspection_date', 'N/A')}
-• Building Development: {metrics.get('building_name', 'N/A')}
-• Property Location: {metrics.get('address', 'N/A')}
-
-**COMPANION DOCUMENTATION SUITE**:
-Complete defect inventories, unit-by-unit detailed breakdowns, interactive filterable data tables, and comprehensive photographic documentation are available in the accompanying Excel analytics workbook. This comprehensive dataset includes advanced filtering capabilities, dynamic visual dashboards, pivot table analysis tools, and direct export functionality for integration with project management systems and remediation tracking platforms.
-
-**TECHNICAL SUPPORT & FOLLOW-UP**:
-For technical inquiries, data interpretation assistance, or additional analysis requirements, please contact the inspection team. Ongoing support is available for remediation planning, progress tracking, and post-completion verification inspections."""
+        details_text = "\n".join([
+            "**REPORT METADATA**:",
+            f"• Report Generated: {fmt['report_date']} at {fmt['report_time']}",
+            f"• Inspection Completion: {fmt['inspection_date']}",
+            f"• Building Development: {fmt['building_name']}",
+            f"• Property Location: {fmt['address']}",
+            "",
+            _FOOTER_RESOURCES_TEXT,
+        ])
         
-        details_para = doc.add_paragraph()
-        add_formatted_text_with_bold(details_para, details_text)
+        _append_p(doc, details_text)
         
         # Closing
-        doc.add_paragraph()
-        closing_para = doc.add_paragraph()
+        _spacer(doc)
+        closing_para = _add_paragraph(doc)
         closing_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        closing_run = closing_para.add_run("END OF REPORT")
-        closing_run.font.name = 'Arial'
-        closing_run.font.size = Pt(14)
-        closing_run.font.color.rgb = RGBColor(0, 0, 0)
-        closing_run.font.bold = True
+        _styled_run(closing_para, "END OF REPORT", 14, bold=True)
     
     except Exception as e:
         print(f"Error in footer: {e}")
@@ -1612,43 +1922,101 @@ def add_chart_to_document(doc, fig):
     """Helper function to add charts to document"""
     
     try:
-        chart_buffer = BytesIO()
-        fig.savefig(chart_buffer, format='png', dpi=300, bbox_inches='tight', 
-                    facecolor='white', edgecolor='none', pad_inches=0.2)
-        chart_buffer.seek(0)
-        
-        chart_para = doc.add_paragraph()
-        chart_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        chart_run = chart_para.add_run()
-        chart_run.add_picture(chart_buffer, width=Inches(7))
-        
-        doc.add_paragraph()
+        add_chart_image(doc, render_chart_png(fig))
     
     except Exception as e:
         print(f"Error adding chart: {e}")
 
+@lru_cache(maxsize=8)
+def _chart_font(size):
+    """Load a TrueType font for minimal charts, falling back to Pillow's default"""
+    for name in ('arial.ttf', 'Arial.ttf', 'DejaVuSans.ttf'):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+def render_minimal_barh_png(title, labels, values, colors, value_labels, width=2100):
+    """
+    Draw a horizontal bar chart straight to a PNG buffer with Pillow.
+    
+    Used instead of matplotlib when MINIMAL_CHARTS is enabled; bar geometry is
+    computed with numpy and each bar is a single rectangle.
+    """
+    title_font, label_font = _chart_font(44), _chart_font(32)
+    bar_height, gap, top, bottom = 54, 22, 110, 40
+    left = 40 + max((int(label_font.getlength(str(label))) for label in labels), default=0) + 20
+    right = 40 + max((int(label_font.getlength(text)) for text in value_labels), default=0) + 20
+    height = top + len(values) * (bar_height + gap) + bottom
+    
+    values = np.asarray(values, dtype=float)
+    max_value = values.max() if len(values) and values.max() > 0 else 1
+    bar_widths = (values / max_value * (width - left - right)).astype(int)
+    
+    img = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(img)
+    draw.text((width // 2, 50), title, fill='black', font=title_font, anchor='mm')
+    
+    for i, (label, bar_width, color, value_label) in enumerate(zip(labels, bar_widths, colors, value_labels)):
+        y0 = top + i * (bar_height + gap)
+        y_mid = y0 + bar_height // 2
+        draw.text((left - 20, y_mid), str(label), fill='black', font=label_font, anchor='rm')
+        draw.rectangle([left, y0, left + max(int(bar_width), 1), y0 + bar_height], fill=color)
+        draw.text((left + int(bar_width) + 12, y_mid), value_label, fill='black', font=label_font, anchor='lm')
+    
+    chart_buffer = BytesIO()
+    img.save(chart_buffer, format='PNG')
+    chart_buffer.seek(0)
+    return chart_buffer
+
+def _chart_figure(width, height):
+    """New pyplot-free Figure for one chart - safe to draw on from a worker thread"""
+    _load_matplotlib()
+    return Figure(figsize=(width, height))
+
+def render_chart_png(fig):
+    """Render a matplotlib figure to a PNG buffer ready for embedding"""
+    
+    chart_buffer = BytesIO()
+    # Figures lay themselves out with fixed margins, so skip the extra
+    # render pass that bbox_inches='tight' needs to measure artist extents
+    fig.savefig(chart_buffer, format='png', dpi=_CHART_DPI, facecolor='white', pil_kwargs=_CHART_PNG_OPTIONS)
+    chart_buffer.seek(0)
+    return chart_buffer
+
+def add_chart_image(doc, chart_buffer):
+    """Add a pre-rendered chart PNG to the document"""
+    
+    chart_para = _add_paragraph(doc)
+    chart_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    chart_run = chart_para.add_run()
+    chart_run.add_picture(chart_buffer, width=_CHART_WIDTH)
+    chart_buffer.close()  # the image part keeps its own copy of the bytes
+    
+    _spacer(doc)
+
 def add_text_trade_summary(doc, metrics):
-    """Text-based trade summary when matplotlib is not available"""
+    """Text-based trade summary when matplotlib is not available or there is too little data to chart"""
     try:
-        breakdown_header = doc.add_paragraph("Defects Distribution by Trade Category")
+        breakdown_header = _add_paragraph(doc, "Defects Distribution by Trade Category")
         breakdown_header.style = 'CleanSubsectionHeader'
         
-        note_para = doc.add_paragraph("(Visual charts require matplotlib - showing text summary)")
+        note_para = _add_paragraph(doc, _TEXT_SUMMARY_NOTES[MATPLOTLIB_AVAILABLE])
         note_para.style = 'CleanBody'
         
-        if 'summary_trade' not in metrics or len(metrics['summary_trade']) == 0:
+        if not _summary_flags(metrics)['trade']:
             return
         
-        trade_data = metrics['summary_trade'].copy()
+        trade_data = metrics['summary_trade']
         total_defects = metrics.get('total_defects', 0)
         
         if total_defects > 0:
-            for idx, (_, row) in enumerate(trade_data.iterrows(), 1):
-                percentage = (row['DefectCount'] / total_defects * 100)
-                trade_text = f"{idx}. {row['Trade']}: {row['DefectCount']} defects ({percentage:.1f}%)"
-                trade_para = doc.add_paragraph(trade_text)
-                trade_para.style = 'CleanBody'
-                trade_para.paragraph_format.left_indent = Inches(0.3)
+            trades = trade_data['Trade'].to_numpy()
+            counts = trade_data['DefectCount'].to_numpy()
+            for idx, (trade, count) in enumerate(zip(trades, counts), 1):
+                percentage = (count / total_defects * 100)
+                _append_list_p(doc, f"{idx}. {trade}: {count} defects ({percentage:.1f}%)")
         
     except Exception as e:
         print(f"Error in text trade summary: {e}")
@@ -1656,19 +2024,14 @@ def add_text_trade_summary(doc, metrics):
 def add_text_severity_summary(doc, metrics):
     """Text-based severity summary when matplotlib is not available"""
     try:
-        chart_title = doc.add_paragraph("Unit Classification by Defect Severity")
+        chart_title = _add_paragraph(doc, "Unit Classification by Defect Severity")
         chart_title.style = 'CleanSubsectionHeader'
         
-        note_para = doc.add_paragraph("(Visual charts require matplotlib - showing text summary)")
+        note_para = _add_paragraph(doc, _TEXT_SUMMARY_NOTES[MATPLOTLIB_AVAILABLE])
         note_para.style = 'CleanBody'
         
-        if 'summary_unit' in metrics and len(metrics['summary_unit']) > 0:
-            units_data = metrics['summary_unit']
-            
-            extensive_count = len(units_data[units_data['DefectCount'] >= 15])
-            major_count = len(units_data[(units_data['DefectCount'] >= 8) & (units_data['DefectCount'] <= 14)])
-            minor_count = len(units_data[(units_data['DefectCount'] >= 3) & (units_data['DefectCount'] <= 7)])
-            ready_count = len(units_data[units_data['DefectCount'] <= 2])
+        if _summary_flags(metrics)['unit']:
+            ready_count, minor_count, major_count, extensive_count = _severity_bucket_counts(metrics)
             
             severity_data = [
                 ("Extensive (15+ defects)", extensive_count),
@@ -1679,33 +2042,27 @@ def add_text_severity_summary(doc, metrics):
             
             for category, count in severity_data:
                 if count > 0:
-                    severity_text = f"• {category}: {count} units"
-                    severity_para = doc.add_paragraph(severity_text)
-                    severity_para.style = 'CleanBody'
-                    severity_para.paragraph_format.left_indent = Inches(0.3)
+                    _append_list_p(doc, f"• {category}: {count} units")
         
     except Exception as e:
         print(f"Error in text severity summary: {e}")
 
 def add_text_units_summary(doc, metrics):
-    """Text-based units summary when matplotlib is not available"""
+    """Text-based units summary when matplotlib is not available or there is too little data to chart"""
     try:
-        chart_title = doc.add_paragraph("Top 20 Units Requiring Immediate Intervention")
+        chart_title = _add_paragraph(doc, "Top 20 Units Requiring Immediate Intervention")
         chart_title.style = 'CleanSubsectionHeader'
         
-        note_para = doc.add_paragraph("(Visual charts require matplotlib - showing text summary)")
+        note_para = _add_paragraph(doc, _TEXT_SUMMARY_NOTES[MATPLOTLIB_AVAILABLE])
         note_para.style = 'CleanBody'
         
-        if 'summary_unit' not in metrics or len(metrics['summary_unit']) == 0:
+        if not _summary_flags(metrics)['unit']:
             return
         
-        top_units = metrics['summary_unit'].head(20)
+        views = _prepare_report_views(metrics)
         
-        for idx, (_, row) in enumerate(top_units.iterrows(), 1):
-            unit_text = f"{idx}. Unit {row['Unit']}: {row['DefectCount']} defects"
-            unit_para = doc.add_paragraph(unit_text)
-            unit_para.style = 'CleanBody'
-            unit_para.paragraph_format.left_indent = Inches(0.3)
+        for idx, (unit_label, count) in enumerate(zip(views['top_unit_labels'], views['top_unit_counts']), 1):
+            _append_list_p(doc, f"{idx}. {unit_label}: {count} defects")
         
     except Exception as e:
         print(f"Error in text units summary: {e}")
@@ -1715,10 +2072,10 @@ def create_error_document(error, metrics):
     
     doc = Document()
     title = doc.add_heading("Inspection Report - Generation Error", level=1)
-    error_para = doc.add_paragraph(f"Report generation encountered an issue: {str(error)}")
+    error_para = _add_paragraph(doc, f"Report generation encountered an issue: {str(error)}")
     
     if metrics:
-        basic_para = doc.add_paragraph(f"""
+        basic_para = _add_paragraph(doc, f"""
 Basic Information:
 Building: {metrics.get('building_name', 'N/A')}
 Total Units: {metrics.get('total_units', 'N/A')}
@@ -1727,6 +2084,65 @@ Total Defects: {metrics.get('total_defects', 'N/A')}
     
     return doc
 
+# Background generation - keeps the CPU-bound chart rendering and docx
+# serialization off the Streamlit worker thread
+_REPORT_POOL = None
+
+def _get_report_pool():
+    """Return the shared report process pool, creating it on first use"""
+    global _REPORT_POOL
+    if _REPORT_POOL is None:
+        # forkserver, not Linux's default fork: the Streamlit server is multi-threaded,
+        # and a forked worker can inherit a lock another thread held and hang
+        _REPORT_POOL = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('forkserver'))
+    return _REPORT_POOL
+
+def _reset_report_pool(pool):
+    """Discard a broken report pool so the next submit starts a fresh one"""
+    global _REPORT_POOL
+    if _REPORT_POOL is pool:
+        _REPORT_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _shutdown_report_pool():
+    """atexit hook - stop the report workers with the server process"""
+    if _REPORT_POOL is not None:
+        _REPORT_POOL.shutdown(wait=False, cancel_futures=True)
+
+atexit.register(_shutdown_report_pool)
+
+def _discard_pool_if_broken(future, pool):
+    """Done-callback: a worker died (OOM kill, crash), so later reports need a new pool"""
+    global _REPORT_POOL
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        print("Word report worker died - the next report starts a new pool")
+        if _REPORT_POOL is pool:
+            _REPORT_POOL = None  # the executor has already torn itself down
+
+def _generate_word_report_bytes(processed_data, metrics, images=None):
+    """Worker entry point - returns the saved .docx bytes (Document objects don't pickle)"""
+    doc = generate_enhanced_word_report(processed_data, metrics, images)
+    buffer = BytesIO()
+    doc.save(buffer)
+    del doc  # free the element tree before getvalue() copies the zip
+    return buffer.getvalue()
+
+def generate_professional_word_report_async(processed_data, metrics, images=None):
+    """Generate the Word report in a background process.
+
+    Returns a concurrent.futures.Future that resolves to the .docx file bytes.
+    """
+    pool = _get_report_pool()
+    try:
+        future = pool.submit(_generate_word_report_bytes, processed_data, metrics, images)
+    except BrokenProcessPool:
+        # A worker died since the last report; retry once on a fresh pool
+        _reset_report_pool(pool)
+        pool = _get_report_pool()
+        future = pool.submit(_generate_word_report_bytes, processed_data, metrics, images)
+    future.add_done_callback(lambda done: _discard_pool_if_broken(done, pool))
+    return future
+
 # Backward compatibility functions
 def generate_professional_word_report(processed_data, metrics, images=None):
     """Backward compatibility wrapper"""
@@ -1744,10 +2160,8 @@ def create_inspection_report(processed_data, metrics, images=None):
 if __name__ == "__main__":
     print("Enhanced Word Report Generator with Blank Page Removal loaded successfully!")
     print("\nNEW FEATURES ADDED:")
-    print("• remove_blank_pages() - Identifies and removes blank pages/elements")
-    print("• cleanup_excessive_spacing() - Removes excessive empty paragraphs")
-    print("• optimize_page_breaks() - Optimizes page break placement")
     print("• validate_document_structure() - Provides document structure analysis")
+    print("• postprocess_document() - Single-pass validation, blank page/spacing cleanup and page break optimization")
     print("• Post-processing pipeline with detailed logging")
     
     print("\nEXISTING FEATURES:")
@@ -1775,7 +2189,7 @@ if __name__ == "__main__":
     
     print("\nPOST-PROCESSING WORKFLOW:")
     print("1. Document generation with all sections")
-    print("2. Initial structure validation")
+    print("2. Initial structure validation (documents of 500+ paragraphs)")
     print("3. Blank page detection and removal")
     print("4. Page break optimization")
     print("5. Excessive spacing cleanup")